@@ -1,6 +1,7 @@
+from collections import deque
 from dataclasses import dataclass
 from PyQt6.QtCore import QObject, pyqtSignal, QRunnable, QThreadPool
-from typing import List, Optional
+from typing import Deque, List, Optional
 from .models import NodeToken
 from .session_manager import SessionConfig, SessionType
 from .services.threading_service import ThreadingService
@@ -21,11 +22,13 @@ class CommandWorkerSignals(QObject):
     command_completed = pyqtSignal(str, str, bool, object)  # command, result, success, token
 
 class CommandWorker(QRunnable):
-    def __init__(self, command: str, token: NodeToken, telnet_session=None):
+    def __init__(self, command: str, token: NodeToken, telnet_session=None, queued_command=None):
         super().__init__()
         self.command = command
         self.token = token
         self.telnet_session = telnet_session
+        # Direct reference to the queue entry for O(1) status updates
+        self.queued_command = queued_command
         self.result = None
         self.success = False
         self.signals = CommandWorkerSignals()
@@ -150,7 +153,10 @@ class CommandWorker(QRunnable):
 
 class CommandQueue(QObject):
     command_completed = pyqtSignal(str, str, bool, object)  # command, result, success, token
-    progress_updated = pyqtSignal(int, int)    # current, total
+    # With defer_taskrun off (default): (completed_count, queue length)
+    # after every command. With defer_taskrun on: a single
+    # (success_count, completed_count) emission when the batch drains.
+    progress_updated = pyqtSignal(int, int)
     
     @property
     def is_processing(self) -> bool:
@@ -165,17 +171,26 @@ class CommandQueue(QObject):
     def __init__(self, session_manager=None, parent=None):
         super().__init__(parent)
         self.logger = logging.getLogger(__name__)
-        self.queue: List[QueuedCommand] = []
+        self.queue: Deque[QueuedCommand] = deque()
         self.thread_pool = QThreadPool()
         self.thread_pool.setMaxThreadCount(1)
         self.completed_count = 0
+        # Batch producers set this to defer progress emissions until the
+        # queue drains: N commands then produce one cross-thread signal
+        # dispatch instead of one apiece. Reset when the batch drains.
+        self.defer_taskrun = False
+        self._success_count = 0
         self.session_manager = session_manager
         self.threading_service = ThreadingService()
         self._is_processing = False
         self._processing_lock = self.threading_service.create_lock()
         
-    def add_command(self, command: str, token: NodeToken, telnet_client=None):
-        """Add a command to the queue with associated token"""
+    def add_command(self, command: str, token: NodeToken, telnet_client=None, auto_start=True):
+        """Add a command to the queue with associated token
+
+        Batch producers pass auto_start=False to enqueue several commands
+        and trigger a single start_processing once the batch is complete.
+        """
         qc = QueuedCommand(
             command=command,
             token=token,
@@ -186,9 +201,9 @@ class CommandQueue(QObject):
         logging.debug(f"CommandQueue.add_command: Token details - type: {token.token_type}, node: {token.name} ({token.ip_address})")
         logging.debug(f"CommandQueue.add_command: Current queue size: {len(self.queue)}")
         logging.debug(f"CommandQueue.add_command: QueuedCommand object created: {qc}")
-        
+
         # Start processing if queue has commands
-        if len(self.queue) > 0:
+        if auto_start and len(self.queue) > 0:
             self.start_processing()
         
     def start_processing(self):
@@ -209,6 +224,7 @@ class CommandQueue(QObject):
         logging.debug(f"CommandQueue.start_processing: Thread pool status - active threads: {self.thread_pool.activeThreadCount()}, max threads: {self.thread_pool.maxThreadCount()}")
         
         self.completed_count = 0
+        self._success_count = 0
         # Only process pending commands
         pending_commands = [cmd for cmd in self.queue if cmd.status == 'pending']
         total = len(pending_commands)
@@ -269,7 +285,7 @@ class CommandQueue(QObject):
                         item.status = 'failed'
                         continue
 
-            worker = CommandWorker(item.command, item.token, telnet_session)
+            worker = CommandWorker(item.command, item.token, telnet_session, queued_command=item)
             logging.debug(f"CommandQueue.start_processing: Created worker for command {idx+1}/{total}: {item.command} (token {item.token.token_id})")
             worker.setAutoDelete(True)
             worker.signals.finished.connect(lambda w=worker: self._handle_worker_finished(w))
@@ -295,53 +311,70 @@ class CommandQueue(QObject):
         log_msg += f"Result: {result[:500]}{'...' if len(result) > 500 else ''}"
         logging.info(log_msg)
         
-        # Update command status
-        updated = False
-        for idx, item in enumerate(self.queue):
-            if item.command == command:
-                item.status = 'completed' if success else 'failed'
-                logging.debug(f"CommandQueue._handle_worker_finished: Updated status for command {idx+1}/{len(self.queue)}: {command} -> {item.status}")
-                updated = True
-                break
-        
-        if not updated:
+        # Update command status through the worker's direct queue-entry
+        # reference; workers built without one (external callers, tests)
+        # fall back to the command-match scan
+        item = worker.queued_command
+        if item is None:
+            for cmd in self.queue:
+                if cmd.command == command:
+                    item = cmd
+                    break
+        if item is not None:
+            item.status = 'completed' if success else 'failed'
+            logging.debug(f"CommandQueue._handle_worker_finished: Updated status for command: {command} -> {item.status}")
+        else:
             logging.error(f"CommandQueue._handle_worker_finished: Could not find command in queue: {command}")
         
         # Clean up completed commands from queue
         original_queue_size = len(self.queue)
-        self.queue = [cmd for cmd in self.queue if cmd.status != 'completed']
+        self.queue = deque(cmd for cmd in self.queue if cmd.status != 'completed')
         cleaned_count = original_queue_size - len(self.queue)
         if cleaned_count > 0:
             logging.debug(f"CommandQueue._handle_worker_finished: Cleaned {cleaned_count} completed commands from queue")
         
-        # Emit progress update
+        if success:
+            self._success_count += 1
+
+        # Emit progress update (per command only when deferral is off)
         remaining = len(self.queue) - self.completed_count
         logging.debug(f"CommandQueue._handle_worker_finished: Progress: {self.completed_count}/{len(self.queue)} completed, {remaining} remaining")
-        self.progress_updated.emit(self.completed_count, len(self.queue))
+        if not self.defer_taskrun:
+            self.progress_updated.emit(self.completed_count, len(self.queue))
         
         # Emit command completion with result
         # Ensure error details are properly propagated
         self.command_completed.emit(command, result, success, worker.token)
         logging.debug(f"CommandQueue._handle_worker_finished: Emitted completion signal for command: {command} (success={success})")
         
-        # Check if all commands are completed (either successfully or failed) and reset processing state if so
-        active_commands = [cmd for cmd in self.queue if cmd.status in ['pending', 'processing']]
-        logging.debug(f"CommandQueue._handle_worker_finished: Checking processing state - active commands: {len(active_commands)}, total in queue: {len(self.queue)}")
-        if not active_commands:
-            logging.info("CommandQueue._handle_worker_finished: All commands processed")
-            # Reset processing state
-            with self._processing_lock:
-                self._is_processing = False
-                logging.info("CommandQueue._handle_worker_finished: Reset processing state to idle (state locked)")
-        else:
-            logging.debug(f"CommandQueue._handle_worker_finished: Still have {len(active_commands)} active commands, keeping processing state")
-        
-        # Auto-continue processing if pending commands remain - atomic check with state lock
+        # Resolve the processing state and any restart decision under a single
+        # lock acquisition; start_processing is invoked after releasing the
+        # lock because it acquires the same (non-reentrant) lock itself.
+        drained = False
+        restart = False
         with self._processing_lock:
-            pending_commands = [cmd for cmd in self.queue if cmd.status == 'pending']
-            if pending_commands and not self._is_processing:
-                logging.debug(f"CommandQueue._handle_worker_finished: Found {len(pending_commands)} pending commands, triggering processing")
-                self.start_processing()
+            active_commands = [cmd for cmd in self.queue if cmd.status in ('pending', 'processing')]
+            logging.debug(f"CommandQueue._handle_worker_finished: Checking processing state - active commands: {len(active_commands)}, total in queue: {len(self.queue)}")
+            if not active_commands:
+                logging.info("CommandQueue._handle_worker_finished: All commands processed, reset processing state to idle (state locked)")
+                self._is_processing = False
+                drained = True
+            else:
+                logging.debug(f"CommandQueue._handle_worker_finished: Still have {len(active_commands)} active commands, keeping processing state")
+            if not self._is_processing and any(cmd.status == 'pending' for cmd in self.queue):
+                restart = True
+
+        # Deliver one coalesced progress emission for the whole batch,
+        # then drop back to per-command emissions
+        if drained and self.defer_taskrun:
+            self.progress_updated.emit(self._success_count, self.completed_count)
+            self._success_count = 0
+            self.defer_taskrun = False
+
+        # Auto-continue processing if pending commands remain
+        if restart:
+            logging.debug("CommandQueue._handle_worker_finished: Found pending commands, triggering processing")
+            self.start_processing()
         
     def validate_token(self, token: NodeToken) -> bool:
         """Validate token has required fields"""
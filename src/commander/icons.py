@@ -40,12 +40,26 @@ def create_token_icon(color: QColor) -> QIcon:
     
     return QIcon(pixmap)
 
-# Create icon instances as functions to defer creation
+# Icons are created lazily on first use (a QApplication must exist) and
+# cached so repeated calls in tree-population loops reuse one instance
+_node_online_icon = None
+_node_offline_icon = None
+_token_icon = None
+
 def get_node_online_icon():
-    return create_node_icon(QColor(50, 168, 82))      # Green
+    global _node_online_icon
+    if _node_online_icon is None:
+        _node_online_icon = create_node_icon(QColor(50, 168, 82))      # Green
+    return _node_online_icon
 
 def get_node_offline_icon():
-    return create_node_icon(QColor(200, 200, 200))   # Gray
+    global _node_offline_icon
+    if _node_offline_icon is None:
+        _node_offline_icon = create_node_icon(QColor(200, 200, 200))   # Gray
+    return _node_offline_icon
 
 def get_token_icon():
-    return create_token_icon(QColor(88, 139, 139))    # CadetBlue
\ No newline at end of file
+    global _token_icon
+    if _token_icon is None:
+        _token_icon = create_token_icon(QColor(88, 139, 139))    # CadetBlue
+    return _token_icon
\ No newline at end of file
@@ -10,6 +10,10 @@ import time
 from datetime import datetime
 from typing import Dict, TextIO, Tuple
 
+# Accepted protocol annotations for log entries
+_VALID_PROTOCOLS = frozenset({'telnet', 'vnc', 'fbc', 'rpc', 'log', 'lis'})
+
+
 class LogWriter:
     def __init__(self, node_manager=None):
         super().__init__()
@@ -182,42 +186,37 @@ class LogWriter:
         try:
             # Use provided protocol or default to "fbc"
             protocol = protocol.lower() if protocol else "fbc"
-            
-            logging.info(f"Attempting to append to log for token {token_id} with protocol {protocol}")
-            
+
+            logging.info("Attempting to append to log for token %s with protocol %s", token_id, protocol)
+
             # Use composite key (token_id, protocol) to find logger
             key = (token_id, protocol)
-            if key not in self.loggers:
+            token_logger = self.loggers.get(key)
+            if token_logger is None:
                 raise ValueError(f"No open log for token ID: {token_id} with protocol {protocol}")
-                
+
             # Handle empty/null content
             safe_content = content.strip() if content else "<empty response>"
             log_path = self.log_paths.get(key, "unknown path")
-            logging.debug(f"Sanitizing content for log: {log_path}")
-            
+            logging.debug("Sanitizing content for log: %s", log_path)
+
             # Validate protocol parameter (just ensure it's a valid protocol, not that it matches file extension)
-            if protocol:
-                valid_protocols = {'telnet', 'vnc', 'fbc', 'rpc', 'log', 'lis'}
-                if protocol.lower() not in valid_protocols:
-                    raise ValueError(f"Invalid protocol: {protocol}")
-            
+            if protocol not in _VALID_PROTOCOLS:
+                raise ValueError(f"Invalid protocol: {protocol}")
+
             # Add source prefix if provided
             prefix = f"[{protocol.upper()}] " if protocol else ""
             formatted = prefix + safe_content
-            
+
             # Add timestamp to each entry
             timestamp = datetime.now().strftime('%H:%M:%S')
-            
+
             try:
                 # Use logger to write formatted message
-                self.loggers[key].info(f"{timestamp} >> {formatted}")
-                logging.info(f"Successfully appended to log for token {token_id} with protocol {protocol}")
-                logging.debug(f"Wrote to log: {log_path}")
-                
-                # Log debugging information
-                logging.debug(f"Using token type: {protocol}")
-                logging.debug(f"Generated log path: {log_path}")
-                
+                token_logger.info(f"{timestamp} >> {formatted}")
+                logging.info("Successfully appended to log for token %s with protocol %s", token_id, protocol)
+                logging.debug("Wrote to log: %s", log_path)
+
             except IOError as e:
                 error_msg = f"Failed to write to log file {log_path}: {str(e)}"
                 logging.error(error_msg, exc_info=True)
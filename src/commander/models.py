@@ -1,8 +1,8 @@
 from dataclasses import dataclass, field
-from typing import Dict
+from typing import Dict, List
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeToken:
     token_id: str
     token_type: str  # FBC/RPC/LOG/LIS - matches file extension exactly
@@ -23,13 +23,25 @@ class NodeToken:
         self.protocol = kwargs.get('protocol', "telnet")
 
 
-@dataclass
+@dataclass(slots=True)
 class Node:
     name: str
     ip_address: str
     status: str = "offline"
     tokens: Dict[str, NodeToken] = field(default_factory=dict)
+    # Secondary lookup indexes kept in sync by add_token for O(1) matching
+    tokens_by_type: Dict[str, List[NodeToken]] = field(default_factory=dict, repr=False, compare=False)
+    tokens_by_id_lower: Dict[str, NodeToken] = field(default_factory=dict, repr=False, compare=False)
 
     def add_token(self, token: NodeToken):
+        existing = self.tokens.get(token.token_id)
+        if existing is not None:
+            # Replacing a token: drop it from the indexes first
+            bucket = self.tokens_by_type.get(existing.token_type)
+            if bucket is not None and existing in bucket:
+                bucket.remove(existing)
+            self.tokens_by_id_lower.pop(existing.token_id.lower(), None)
         self.tokens[token.token_id] = token
+        self.tokens_by_type.setdefault(token.token_type, []).append(token)
+        self.tokens_by_id_lower[token.token_id.lower()] = token
 
@@ -2,16 +2,52 @@
 Node Manager
 Loads and manages node configuration for Commander UI
 """
+import functools
 import json
 import os
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 from .models import Node, NodeToken
 
+# Token types recognized in the log directory structure
+_TOKEN_TYPES = frozenset({"FBC", "RPC", "LOG", "LIS"})
+# Log file extensions (lowercase) matching the token types above
+_LOG_EXTS = (".log", ".fbc", ".rpc", ".lis")
+# Path separator and lowercase extension map cached for _generate_log_path
+_SEP = os.sep
+_EXT_LOWER = {"FBC": "fbc", "RPC": "rpc", "LOG": "log", "LIS": "lis"}
+
+
+@functools.lru_cache(maxsize=4096)
+def _generate_log_path_cached(log_root: str, node_name: str, token_id: str,
+                              log_type: str, ip_address: str) -> str:
+    """Builds a standardized log path; cached across repeated reloads"""
+    # Format IP address: 192.168.0.11 -> 192-168-0-11
+    formatted_ip = ip_address.replace('.', '-')
+    ext = _EXT_LOWER.get(log_type) or log_type.lower()
+
+    # Path: <log_root>/<token_type>/<node_name>/<filename>; a single
+    # f-string skips the per-segment checks os.path.join would do
+    return (f"{log_root}{_SEP}{log_type}{_SEP}{node_name}{_SEP}"
+            f"{node_name}_{token_id}_{formatted_ip}_{token_id}.{ext}")
+
+
+@functools.lru_cache(maxsize=4096)
+def _token_distance(token1: str, token2: str) -> int:
+    """Calculates similarity distance between two lowercased token IDs"""
+    if token1 == token2:
+        return 0
+    if token1.startswith(token2) or token2.startswith(token1):
+        return 1
+    return 2
+
 class NodeManager:
     def __init__(self):
         self.nodes: Dict[str, Node] = {}
+        # Case-insensitive node lookup index, rebuilt on parse and scan
+        self._nodes_by_lower_name: Dict[str, Node] = {}
         # Set log root to user's DIA directory
         # Set log root to project's test_logs directory
         self.log_root = os.path.join(
@@ -25,6 +61,10 @@ class NodeManager:
             os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
             "nodes_test.json"
         )
+        # Cache key of the last successfully parsed configuration file
+        self._config_cache_key = None
+        # Deferred-scan flag: set when log files may be stale, cleared by scan_log_files
+        self._logs_dirty = True
         # Load configuration immediately after setting path
         self.load_configuration()
         
@@ -35,8 +75,13 @@ class NodeManager:
     def set_log_root(self, path):
         """Set the root folder for log files"""
         self.log_root = path
-        # Update log paths when log root changes
-        self.scan_log_files()
+        # Defer the rescan until token data is actually requested
+        self._logs_dirty = True
+
+    def _ensure_scanned(self):
+        """Runs a deferred log scan if log data may be stale"""
+        if self._logs_dirty:
+            self.scan_log_files()
         
     def load_configuration(self, file_path: str = None) -> bool:
         """Loads node configuration from JSON file"""
@@ -53,10 +98,22 @@ class NodeManager:
             if not os.path.exists(normalized_path):
                 print(f"Configuration file does not exist: {normalized_path}")
                 return False
-                
+
+            # Skip the full reparse when the file is unchanged since last load
+            try:
+                stat = os.stat(normalized_path)
+                cache_key = (normalized_path, stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                cache_key = None
+            if cache_key is not None and cache_key == self._config_cache_key:
+                print(f"Configuration unchanged, skipping reload: {normalized_path}")
+                return True
+
             with open(normalized_path, 'r', encoding='utf-8') as f:
                 config_data = json.load(f)
                 self._parse_config(config_data)
+            self._config_cache_key = cache_key
+            self._logs_dirty = True
             print("Configuration loaded successfully")
             return True
         except FileNotFoundError:
@@ -74,9 +131,6 @@ class NodeManager:
             
     def _parse_config(self, config_data: dict):
         """Parses raw configuration into Node objects, supports multiple formats"""
-        self.nodes.clear()  # Clear existing nodes
-        
-        # Check if this is the old format (array of nodes without nested tokens)
         # Check if this is the old format (array of nodes with string tokens arrays)
         if isinstance(config_data, list) and config_data:
             first_node = config_data[0]
@@ -86,82 +140,81 @@ class NodeManager:
                 isinstance(first_node['tokens'], list) and
                 all(isinstance(t, str) for t in first_node['tokens'])
             )
-            
+
             if is_old_format:
                 print("Detected old format - converting to new format")
                 config_data = self._convert_old_format(config_data)
-        
-        for node_data in config_data:
+
+        # Pass 1: filter to entries with the required fields, no per-entry logging
+        clean = [
+            nd for nd in config_data
+            if isinstance(nd, dict) and "name" in nd and "ip_address" in nd
+        ]
+
+        # Pass 2: construct the nodes; a malformed entry skips just that
+        # node, as before, rather than failing the whole load
+        self.nodes = {}
+        for nd in clean:
+            try:
+                self.nodes[nd["name"]] = self._build_node(nd)
+            except Exception as e:
+                print(f"Error processing node: {str(e)}")
+        self._nodes_by_lower_name = {name.lower(): node for name, node in self.nodes.items()}
+
+        skipped = len(config_data) - len(clean)
+        if skipped:
+            print(f"Skipped {skipped} invalid node entries")
+        print(f"Parsed {len(self.nodes)} nodes from configuration")
+
+    def _build_node(self, node_data: dict) -> Node:
+        """Builds a single Node with its tokens from a validated config entry"""
+        node = Node(
+            name=node_data["name"],
+            ip_address=node_data["ip_address"]
+        )
+
+        for token_data in node_data.get("tokens", []):
             try:
-                # Skip entries that don't have required fields
-                if "name" not in node_data or "ip_address" not in node_data:
-                    print(f"Skipping invalid node entry: {node_data}")
+                # Validate required fields exist
+                token_id = token_data.get("token_id")
+                if token_id is None or "token_type" not in token_data or "port" not in token_data:
+                    print(f"Skipping invalid token entry: {token_data}")
                     continue
-                    
-                node = Node(
-                    name=node_data["name"],
-                    ip_address=node_data["ip_address"]
+
+                # Ensure token_id is a string and strip whitespace
+                token_id = str(token_id).strip()
+                if not token_id:  # Check if empty after stripping
+                    print(f"Skipping token with empty 'token_id' in node '{node.name}'")
+                    continue
+
+                # Normalize token type to uppercase for consistent classification
+                token_type = token_data["token_type"].upper()
+
+                # Normalize FBC token IDs: pad numeric IDs with zeros, convert alphanumeric to uppercase
+                if token_type == "FBC":
+                    token_id = token_id.zfill(3) if token_id.isdigit() else token_id.upper()
+
+                token = NodeToken(
+                    name=node.name,
+                    token_id=token_id,
+                    token_type=token_type,
+                    ip_address=token_data.get("ip_address", node.ip_address),
+                    port=token_data["port"],
+                    protocol=token_data.get("protocol", "telnet")
                 )
-                
-                tokens = node_data.get("tokens", [])
-                for token_data in node_data.get('tokens', []):
-                    token_id = token_data.get('token_id')
-                    if token_id is None:
-                        print(f"Warning: Skipping token with missing 'token_id' in node '{node_name}'.")
-                        continue
-                    
-                    # Ensure token_id is a string and strip whitespace
-                    token_id = str(token_id).strip()
-                    if not token_id:  # Check if empty after stripping
-                        print(f"Warning: Skipping token with empty 'token_id' in node '{node_name}'.")
-                        continue
-                        
-                    # Normalize FBC token IDs: pad numeric IDs with zeros, convert alphanumeric to uppercase
-                    if token_data["token_type"].upper() == "FBC":
-                        if token_id.isdigit():
-                            token_id = token_id.zfill(3)
-                        else:
-                            token_id = token_id.upper()
-
-                    try:
-                        # Validate required fields exist
-                        if "token_type" not in token_data or "port" not in token_data:
-                            print(f"Skipping invalid token entry: {token_data}")
-                            continue
-                            
-                        # Normalize token type to uppercase for consistent classification
-                        token_type = token_data["token_type"].upper()
-                        
-                        # Ensure token_id is string and exists
-                        token_id = str(token_id).strip()
-                        if not token_id:
-                            print(f"Skipping token with empty 'token_id' in node '{node.name}'")
-                            continue
-     
-                        
-                        token = NodeToken(
-                            name=node.name,
-                            token_id=token_id,
-                            token_type=token_type,
-                            ip_address=token_data.get("ip_address", node.ip_address),
-                            port=token_data["port"],
-                            protocol=token_data.get("protocol", "telnet")
-                        )
-                        # Generate log path with formatted IP
-                        token.log_path = self._generate_log_path(
-                            node.name,
-                            token.token_id,
-                            token.token_type,
-                            token.ip_address
-                        )
-                        
-                        node.add_token(token)
-                    except Exception as e:
-                        print(f"Error processing token: {str(e)}")
-                
-                self.nodes[node.name] = node
+                # Generate log path with formatted IP
+                token.log_path = self._generate_log_path(
+                    node.name,
+                    token.token_id,
+                    token.token_type,
+                    token.ip_address
+                )
+
+                node.add_token(token)
             except Exception as e:
-                print(f"Error processing node: {str(e)}")
+                print(f"Error processing token: {str(e)}")
+
+        return node
                 
     def _convert_old_format(self, old_config: list) -> list:
         """Converts old configuration format to new format"""
@@ -200,6 +253,9 @@ class NodeManager:
         Handles all file locations and structures
         """
         root = log_root or self.log_root
+        self._logs_dirty = False
+        # Rebuild the lookup index in case self.nodes was assigned directly
+        self._nodes_by_lower_name = {name.lower(): node for name, node in self.nodes.items()}
         print(f"[DEBUG] Scanning log root: {root}")
         if not os.path.exists(root):
             print(f"[DEBUG] ERROR: Log root does not exist")
@@ -209,27 +265,34 @@ class NodeManager:
         self._scan_for_dynamic_ips(root)
             
         print(f"[DEBUG] Log root exists")
-        
-        # Check directory structure
-        token_types = ["FBC", "RPC", "LOG", "LIS"]
-        for token_type in token_types:
-            token_dir = os.path.join(root, token_type)
-            if os.path.exists(token_dir):
-                print(f"[DEBUG] Found token directory: {token_type}")
-                node_dirs = os.listdir(token_dir)
-                print(f"[DEBUG] Found {len(node_dirs)} node directories in {token_type}: {node_dirs}")
-            else:
-                print(f"[DEBUG] WARNING: Token directory not found: {token_type}")
-        
         print(f"[DEBUG] Starting recursive scan of: {root}")
-        
-        # Walk through all directories and files
-        for dirpath, _, filenames in os.walk(root):
-            # Skip directories without .log files
-            log_files = [f for f in filenames if f.lower().endswith(('.log', '.fbc', '.rpc', '.lis'))]
-            if not log_files:
-                continue
-                
+
+        # Walk top-level subtrees in parallel: the traversal is I/O bound
+        # (stat/readdir release the GIL), while node/token matching below
+        # stays serial so self.nodes is only mutated from this thread
+        try:
+            top_entries = os.listdir(root)
+        except OSError as e:
+            print(f"[DEBUG] ERROR: Cannot list log root: {e}")
+            top_entries = []
+
+        scanned = []
+        root_files = [
+            f for f in top_entries
+            if os.path.splitext(f)[1].lower() in _LOG_EXTS
+            and os.path.isfile(os.path.join(root, f))
+        ]
+        if root_files:
+            scanned.append((root, root_files))
+
+        subtrees = [p for p in (os.path.join(root, e) for e in top_entries)
+                    if os.path.isdir(p)]
+        if subtrees:
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                for result in pool.map(self._scan_subtree, subtrees):
+                    scanned.extend(result)
+
+        for dirpath, log_files in scanned:
             print(f"[DEBUG] Found {len(log_files)} log files in {dirpath}")
             
             for filename in log_files:
@@ -247,7 +310,7 @@ class NodeManager:
                 if filename.lower().endswith('.log'):
                     token_type_dir = "LOG"
                     # Extract node name from filename (before first underscore)
-                    node_name = filename.split('_')[0]
+                    node_name = filename.partition('_')[0]
                     print(f"[DEBUG] LOG file detected: node_name={node_name}")
                 # Handle other file types by directory structure
                 else:
@@ -256,7 +319,7 @@ class NodeManager:
                     
                     # Handle nested directories (e.g., FBC/AP01m/)
                     parent_dir = os.path.basename(os.path.dirname(dirpath))
-                    if parent_dir in token_types:
+                    if parent_dir in _TOKEN_TYPES:
                         token_type_dir = parent_dir
                         node_name = os.path.basename(dirpath)
                         print(f"[DEBUG] {token_type_dir} file in node directory: node_name={node_name}")
@@ -266,10 +329,7 @@ class NodeManager:
                         print(f"[DEBUG] {token_type_dir} file: node_name={node_name}")
                 
                 # Find matching node (case-insensitive)
-                matched_node = next(
-                    (n for n in self.nodes.values() if n.name.lower() == node_name.lower()),
-                    None
-                )
+                matched_node = self._nodes_by_lower_name.get(node_name.lower())
                 
                 if not matched_node:
                     print(f"[DEBUG] WARNING: No node found for: {node_name}")
@@ -280,9 +340,9 @@ class NodeManager:
                 token = None
                 matching_strategy = "none"
                 
-                # Extract token ID from filename (last alphanumeric part)
-                parts = base_name.split('_')
-                token_id_candidate = parts[-1] if parts else None
+                # Extract token ID from filename (last alphanumeric part);
+                # rpartition avoids allocating the full list of parts
+                token_id_candidate = base_name.rpartition('_')[2] or None
                 
                 # Normalize token ID candidate:
                 # - Pad numeric IDs to 3 digits
@@ -297,28 +357,27 @@ class NodeManager:
                         # For non-FBC tokens, just strip whitespace
                         token_id_candidate = token_id_candidate.strip()
                 
+                # Lowercase the candidate once; the strategies below reuse it
+                # against the pre-lowered ids in tokens_by_id_lower
+                cand_lower = token_id_candidate.lower() if token_id_candidate else None
+
                 # Strategy 1: Case-insensitive exact token ID match
-                if token_id_candidate:
-                    token = next(
-                        (t for t in matched_node.tokens.values()
-                         if t.token_id.lower() == token_id_candidate.lower()),
-                        None
-                    )
+                if cand_lower:
+                    token = matched_node.tokens_by_id_lower.get(cand_lower)
                     if token:
                         matching_strategy = "extracted token ID match"
-                
+
                 # Strategy 2: Case-insensitive token ID substring match
-                if not token:
-                    for t in matched_node.tokens.values():
-                        if token_id_candidate and token_id_candidate.lower() in t.token_id.lower():
+                if not token and cand_lower:
+                    for id_lower, t in matched_node.tokens_by_id_lower.items():
+                        if cand_lower in id_lower:
                             token = t
                             matching_strategy = "token ID in filename"
                             break
                 
                 # Strategy 3: Match by token type and closest alphanumeric match
                 if not token:
-                    same_type_tokens = [t for t in matched_node.tokens.values()
-                                        if t.token_type == token_type_dir]
+                    same_type_tokens = matched_node.tokens_by_type.get(token_type_dir, [])
                     if same_type_tokens and token_id_candidate:
                         # DEBUG: Log alphanumeric matching attempt
                         print(f"[DEBUG] Starting Strategy 3 for alphanumeric token: {token_id_candidate}")
@@ -327,11 +386,11 @@ class NodeManager:
                         # Try to find closest alphanumeric match
                         token = min(
                             same_type_tokens,
-                            key=lambda t: self._token_distance(t.token_id.lower(), token_id_candidate.lower())
+                            key=lambda t: _token_distance(t.token_id.lower(), cand_lower)
                         )
-                        
+
                         # DEBUG: Log match result
-                        distance = self._token_distance(token.token_id.lower(), token_id_candidate.lower())
+                        distance = _token_distance(token.token_id.lower(), cand_lower)
                         print(f"[DEBUG] Closest match: {token.token_id} (distance: {distance})")
                         matching_strategy = "closest alphanumeric token match"
                 
@@ -350,7 +409,7 @@ class NodeManager:
                     print(f"[DEBUG] ADDED FBC token to node: {token.token_id} | Path: {normalized_path}")
                 
                 # For other token types, maintain existing behavior
-                elif token_type_dir == "LOG" or (not token and token_type_dir in token_types):
+                elif token_type_dir == "LOG" or (not token and token_type_dir in _TOKEN_TYPES):
                     token = NodeToken(
                         name=f"{node_name} {token_type_dir}",
                         token_id=token_id_candidate or "UNKNOWN",
@@ -374,26 +433,27 @@ class NodeManager:
                     print(f"[DEBUG] WARNING: Could not find matching token for: {filename} in node: {node_name}")
                     print(f"[DEBUG] Available tokens: {[t.token_id for t in matched_node.tokens.values()]}")
                     print(f"[DEBUG] Token ID candidate: {token_id_candidate}")
+
+    def _scan_subtree(self, top: str):
+        """Collects (dirpath, log filenames) pairs below one subtree"""
+        results = []
+        for dirpath, _, filenames in os.walk(top):
+            log_files = [f for f in filenames if os.path.splitext(f)[1].lower() in _LOG_EXTS]
+            if log_files:
+                results.append((dirpath, log_files))
+        return results
+
     def _generate_log_path(self, node_name: str, token_id: str, log_type: str, ip_address: str) -> str:
         """Generates standardized log path with formatted IP"""
-        # Format IP address: 192.168.0.11 -> 192-168-0-11
-        formatted_ip = ip_address.replace('.', '-')
-        
-        # Create path: <log_root>/<token_type>/<node_name>/<filename>
-        filename = f"{node_name}_{token_id}_{formatted_ip}_{token_id}.{log_type.lower()}"
-        return os.path.join(self.log_root, log_type, node_name, filename)
+        # The log root is part of the cache key, so reloads with the same
+        # root hit the memoized path builder
+        return _generate_log_path_cached(self.log_root, node_name, token_id,
+                                         log_type, ip_address)
     
     def _token_distance(self, token1: str, token2: str) -> int:
         """Calculates similarity distance between two token IDs"""
-        # Normalize tokens to lowercase for case-insensitive comparison
-        token1 = token1.lower()
-        token2 = token2.lower()
-        
-        if token1 == token2:
-            return 0
-        if token1.startswith(token2) or token2.startswith(token1):
-            return 1
-        return 2
+        # Normalize to lowercase, then use the memoized module-level helper
+        return _token_distance(token1.lower(), token2.lower())
     
     def _scan_for_dynamic_ips(self, log_root: str):
         """
@@ -446,14 +506,18 @@ class NodeManager:
     
     def get_token(self, node_name: str, token_id: str) -> Optional[NodeToken]:
         """Retrieves token from a node with normalized token ID"""
+        self._ensure_scanned()
         if node := self.nodes.get(node_name):
+            # Bind the tokens dict locally before the lookup
+            tokens = node.tokens
             # Normalize token ID by stripping and converting to string
             normalized_id = str(token_id).strip()
-            return node.tokens.get(normalized_id)
+            return tokens.get(normalized_id)
         return None
         
     def get_node_by_token(self, token: NodeToken) -> Optional[Node]:
         """Finds the node that owns a given token"""
+        self._ensure_scanned()
         for node in self.nodes.values():
             if token.token_id in node.tokens:
                 return node
@@ -466,6 +530,7 @@ class NodeManager:
     
     def get_all_nodes(self) -> List[Node]:
         """Returns all nodes as list"""
+        self._ensure_scanned()
         return list(self.nodes.values())
         
     def add_node(self, node_data: dict):
@@ -474,8 +539,8 @@ class NodeManager:
             name=node_data["name"],
             ip_address=node_data["ip_address"]
         )
-        
-        for token_data in node_data["tokens"]:
+
+        def make_token(token_data):
             token = NodeToken(
                 name=f"{node.name} {token_data['token_id']}",
                 token_id=token_data["token_id"],
@@ -490,37 +555,46 @@ class NodeManager:
                 token.token_type,
                 token.ip_address
             )
+            return token
+
+        # Construct all tokens first, then register them; add_token keeps
+        # the per-node lookup indexes in sync, so tokens is not assigned
+        # wholesale here
+        for token in [make_token(td) for td in node_data["tokens"]]:
             node.add_token(token)
-            
+
         self.nodes[node.name] = node
-    
+        self._nodes_by_lower_name[node.name.lower()] = node
+        self._logs_dirty = True
+
     def save_configuration(self, file_path: str = None) -> bool:
         """Saves current configuration to JSON file"""
         if file_path is None:
             file_path = self.config_path
-        config_data = []
-        for node in self.nodes.values():
-            node_data = {
+        config_data = [
+            {
                 "name": node.name,
                 "ip_address": node.ip_address,
-                "tokens": []
+                "tokens": [
+                    {
+                        "token_id": token.token_id,
+                        "token_type": token.token_type,
+                        "ip_address": token.ip_address,
+                        "port": token.port,
+                        "protocol": token.protocol
+                    }
+                    for token in node.tokens.values()
+                ]
             }
-            
-            for token in node.tokens.values():
-                token_data = {
-                    "token_id": token.token_id,
-                    "token_type": token.token_type,
-                    "ip_address": token.ip_address,
-                    "port": token.port,
-                    "protocol": token.protocol
-                }
-                node_data["tokens"].append(token_data)
-                
-            config_data.append(node_data)
-            
+            for node in self.nodes.values()
+        ]
+
         try:
+            # Serialize to memory first so the file gets one large write
+            # instead of many small ones from json.dump
+            data = json.dumps(config_data, indent=2)
             with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f, indent=2)
+                f.write(data)
             return True
         except (OSError, TypeError):
             return False
@@ -542,5 +616,6 @@ class NodeManager:
         """Get all tokens of specified type for selected node"""
         if not self.selected_node:
             return []
-        return [t for t in self.selected_node.tokens.values()
-                if t.token_type == token_type.upper()]
+        # tokens_by_type is maintained by Node.add_token, so this is a
+        # dict lookup instead of a scan over every token
+        return list(self.selected_node.tokens_by_type.get(token_type.upper(), []))
@@ -23,7 +23,7 @@ from ..services.context_menu_filter import ContextMenuFilterService
 from ..widgets import ConnectionBar, ConnectionState
 from ..services.status_service import StatusService
 from ..ui.commander_ui_factory import CommanderUIFactory
-from .commander_presenter_utils import CommanderPresenterUtils
+from .commander_presenter_utils import CommanderPresenterUtils, report_error
 
 
 class CommanderPresenter(QObject):
@@ -87,7 +87,7 @@ class CommanderPresenter(QObject):
         
         # Utility class for helper functions
         self.utils = CommanderPresenterUtils(node_manager, log_writer)
-        
+
         logging.debug("CommanderPresenter initialized")
     
     def _report_error(self, message: str, exception: Optional[Exception] = None, duration: int = 5000):
@@ -99,9 +99,7 @@ class CommanderPresenter(QObject):
             exception: Optional exception that occurred
             duration: Duration to display the message in milliseconds
         """
-        error_msg = f"{message}: {str(exception)}" if exception else message
-        logging.error(error_msg)
-        self.status_message_signal.emit(error_msg, duration)
+        report_error(self.status_message_signal, message, exception, duration)
     
     def load_configuration(self) -> None:
         """Load node configuration from selected file."""
@@ -115,6 +113,7 @@ class CommanderPresenter(QObject):
             try:
                 if self.node_manager.load_configuration(file_path):
                     self.node_manager.scan_log_files()
+                    self.utils.clear_path_cache()
                     # Update the view
                     self.populate_node_tree()
                     self.status_message_signal.emit("Configuration loaded successfully", 3000)
@@ -135,6 +134,7 @@ class CommanderPresenter(QObject):
                 self.node_manager.set_log_root(folder_path)
                 # Rescan log files after setting new root
                 self.node_manager.scan_log_files()
+                self.utils.clear_path_cache()
                 # Update the view
                 self.populate_node_tree()
                 self.status_message_signal.emit("Log root folder set successfully", 3000)
@@ -213,6 +213,10 @@ class CommanderPresenter(QObject):
     def clear_node_log(self, selected_items) -> None:
         """Clear the currently selected node's log file."""
         self.utils.clear_node_log(selected_items, self.status_message_signal)
+
+    def close_log_handles(self) -> None:
+        """Close any cached log file handles held by the utils."""
+        self.utils.close_log_handles()
     
     def open_log_file(self, item: QTreeWidgetItem, column: int) -> bool:
         """
@@ -5,7 +5,8 @@ import os
 import logging
 from typing import List
 from PyQt6.QtWidgets import QTreeWidgetItem, QTabWidget, QTextEdit
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer, QRunnable, QThreadPool, QUrl
+from PyQt6.QtGui import QDesktopServices
 
 from ..models import NodeToken
 from ..node_manager import NodeManager
@@ -13,13 +14,152 @@ from ..log_writer import LogWriter
 from ..services.status_service import StatusService
 
 
+def report_error(status_message_signal, message: str, exception=None, duration: int = 5000) -> None:
+    """
+    Log an error and surface it on the status bar.
+
+    Shared by the presenters so the logging and status formatting stay
+    in one place.
+
+    Args:
+        status_message_signal: Signal carrying (message, duration)
+        message: Error message to display
+        exception: Optional exception that occurred
+        duration: Duration to display the message in milliseconds
+    """
+    # %-style args defer formatting until the logger accepts the record
+    if exception is not None:
+        logging.error("%s: %s", message, exception)
+        error_msg = f"{message}: {exception}"
+    else:
+        logging.error(message)
+        error_msg = message
+    status_message_signal.emit(error_msg, duration)
+
+
+class _OpenLogFileRunnable(QRunnable):
+    """Opens a log file with the system default application off the GUI thread"""
+
+    def __init__(self, log_path: str, status_message_signal):
+        super().__init__()
+        self.log_path = log_path
+        self.status_message_signal = status_message_signal
+
+    def run(self):
+        try:
+            if hasattr(os, 'startfile'):
+                os.startfile(self.log_path)  # Windows-specific
+            else:
+                QDesktopServices.openUrl(QUrl.fromLocalFile(self.log_path))
+            self.status_message_signal.emit(f"Opened log file: {os.path.basename(self.log_path)}", 3000)
+        except Exception as e:
+            self.status_message_signal.emit(f"Error opening file: {str(e)}", 5000)
+
+
 class CommanderPresenterUtils:
     """Utility class for the Commander presenter"""
     
     def __init__(self, node_manager: NodeManager, log_writer: LogWriter):
         self.node_manager = node_manager
         self.log_writer = log_writer
-    
+        # Latest pending status per signal, flushed once per event-loop turn
+        self._pending_status = {}
+        # Buffered append handles keyed by log path, flushed on a 1s timer
+        self._fh_cache = {}
+        self._flush_timer = None
+        # Display filenames keyed by (node_name, token_id, token_type)
+        self._filename_cache = {}
+
+    def _queue_status(self, status_message_signal, message: str, duration: int) -> None:
+        """
+        Coalesce status messages so bursts trigger one status-bar update.
+
+        Only the most recent message per signal is kept; the emit happens
+        when control returns to the event loop.
+        """
+        first = status_message_signal not in self._pending_status
+        self._pending_status[status_message_signal] = (message, duration)
+        if first:
+            QTimer.singleShot(0, lambda: self._flush_status(status_message_signal))
+
+    def _flush_status(self, status_message_signal) -> None:
+        """Emit the most recent pending status for a signal"""
+        pending = self._pending_status.pop(status_message_signal, None)
+        if pending is not None:
+            status_message_signal.emit(*pending)
+
+    def _get_log_handle(self, log_path: str):
+        """
+        Return a cached buffered append handle for a log path.
+
+        Keeping handles open avoids a path resolve and open/close pair on
+        every copy; buffered writes are flushed once a second.
+        """
+        fh = self._fh_cache.get(log_path)
+        if fh is None:
+            fh = open(log_path, 'a', buffering=65536)
+            self._fh_cache[log_path] = fh
+            if self._flush_timer is None:
+                self._flush_timer = QTimer()
+                self._flush_timer.setInterval(1000)
+                self._flush_timer.timeout.connect(self._flush_log_handles)
+                self._flush_timer.start()
+        return fh
+
+    def _flush_log_handles(self) -> None:
+        """Flush all cached log handles"""
+        for fh in self._fh_cache.values():
+            fh.flush()
+
+    def _drop_log_handle(self, log_path: str) -> None:
+        """Close and forget the cached handle for a path, if any"""
+        fh = self._fh_cache.pop(log_path, None)
+        if fh is not None:
+            fh.close()
+
+    def _stream_document_to_file(self, doc, fh) -> None:
+        """
+        Write a QTextDocument to a file one block at a time.
+
+        Keeps peak memory at O(block) instead of materializing the whole
+        session buffer through toPlainText().
+        """
+        block = doc.firstBlock()
+        while block.isValid():
+            fh.write(block.text())
+            fh.write("\n")
+            block = block.next()
+
+    def _resolve_log_filename(self, node_name: str, token_id: str, token_type: str) -> str:
+        """
+        Resolve the display filename for a token's log, memoized per token.
+
+        The underlying mapping only changes when the configuration or log
+        root does, at which point clear_path_cache drops the entries.
+        """
+        key = (node_name, token_id, token_type)
+        filename = self._filename_cache.get(key)
+        if filename is None:
+            node = self.node_manager.get_node(node_name)
+            if not node:
+                return ""
+            ip = node.ip_address.replace('.', '-')
+            filename = f"{node_name}_{ip}_{token_id}.{token_type.lower()}"
+            self._filename_cache[key] = filename
+        return filename
+
+    def clear_path_cache(self) -> None:
+        """Drop memoized filenames after a config or log-root change"""
+        self._filename_cache.clear()
+
+    def close_log_handles(self) -> None:
+        """Close all cached log handles (called on window close)"""
+        if self._flush_timer is not None:
+            self._flush_timer.stop()
+        for fh in self._fh_cache.values():
+            fh.close()
+        self._fh_cache.clear()
+
     def copy_to_log(self, selected_items, session_tabs: QTabWidget, status_message_signal) -> None:
         """
         Copies current session content to selected token or log file.
@@ -30,14 +170,9 @@ class CommanderPresenterUtils:
             status_message_signal: Signal to emit status messages
         """
         if not selected_items:
-            status_message_signal.emit("No item selected! Select a token or log file on the left.", 3000)
-            return
-        item = selected_items[0]
-        data = item.data(0, Qt.ItemDataRole.UserRole)
-        if not data:
-            status_message_signal.emit("Selected item has no data", 3000)
+            self._queue_status(status_message_signal, "No item selected! Select a token or log file on the left.", 3000)
             return
-            
+
         tab_index = session_tabs.currentIndex()
         session_type = session_tabs.tabText(tab_index)
         
@@ -46,83 +181,107 @@ class CommanderPresenterUtils:
             if session_type == "Telnet":
                 # This would need to be passed from the presenter
                 # For now, we'll assume it's accessible through the view
-                content = ""
-            else:
-                tab_widget = session_tabs.widget(tab_index)
+                self._queue_status(status_message_signal, "No content in current session", 3000)
+                return
+
+            tab_widget = session_tabs.widget(tab_index)
+            # Prefer the direct reference set by the UI factory; fall
+            # back to the layout walk for tabs built elsewhere
+            content_widget = getattr(tab_widget, 'content_widget', None)
+            if content_widget is None:
                 content_widget = tab_widget.layout().itemAt(0).widget()
-                if isinstance(content_widget, QTextEdit):
-                    content = content_widget.toPlainText()
-                else:
+                if not isinstance(content_widget, QTextEdit):
                     return
 
-            if not content:
-                status_message_signal.emit("No content in current session", 3000)
+            doc = content_widget.document()
+            # An empty document still counts its trailing null character
+            if doc.characterCount() <= 1:
+                self._queue_status(status_message_signal, "No content in current session", 3000)
                 return
+            # Materialized lazily; only log_writer targets need the full string
+            content = None
 
-            # Handle based on item type
-            if "log_path" in data:
-                log_path = data["log_path"]
-                # Write directly to the file
-                with open(log_path, 'a') as f:
-                    f.write(content + "\n")
-                filename = os.path.basename(log_path)
-                status_message_signal.emit(f"Content copied to {filename}", 3000)
+            # Bucket direct log-path targets so each file is opened once even
+            # when several selected items resolve to the same log
+            path_counts = {}
+            copied_names = []
+            for sel in selected_items:
+                sel_data = sel.data(0, Qt.ItemDataRole.UserRole)
+                if not sel_data:
+                    continue
 
-            elif "token" in data:
-                token_id = data["token"]
-                node_name = data.get("node")
-                token_type = data.get("token_type")
-                if not node_name or not token_type:
-                    status_message_signal.emit("Token item missing node or token_type", 3000)
-                    return
+                if "log_path" in sel_data:
+                    log_path = sel_data["log_path"]
+                    path_counts[log_path] = path_counts.get(log_path, 0) + 1
+                    copied_names.append(log_path.rpartition(os.sep)[2])
 
-                node = self.node_manager.get_node(node_name)
-                if not node:
-                    status_message_signal.emit(f"Node {node_name} not found", 3000)
-                    return
+                elif "token" in sel_data:
+                    token_id = sel_data["token"]
+                    node_name = sel_data.get("node")
+                    token_type = sel_data.get("token_type")
+                    if not node_name or not token_type:
+                        self._queue_status(status_message_signal, "Token item missing node or token_type", 3000)
+                        continue
 
-                # Reconstruct the log path for display
-                ip = node.ip_address.replace('.', '-')
-                log_dir = os.path.join(self.node_manager.log_root, token_type, node_name)
-                filename = f"{node_name}_{ip}_{token_id}.{token_type.lower()}"
-                # Write using the log_writer
-                self.log_writer.append_to_log(token_id, content, source=session_type)
-                status_message_signal.emit(f"Content copied to {filename}", 3000)
+                    # Memoized display filename; empty means unknown node
+                    filename = self._resolve_log_filename(node_name, token_id, token_type)
+                    if not filename:
+                        self._queue_status(status_message_signal, f"Node {node_name} not found", 3000)
+                        continue
 
-            else:
-                status_message_signal.emit("Unsupported item type", 3000)
+                    # Write using the log_writer
+                    if content is None:
+                        content = doc.toPlainText()
+                    self.log_writer.append_to_log(token_id, content, source=session_type)
+                    copied_names.append(filename)
+
+                else:
+                    self._queue_status(status_message_signal, "Unsupported item type", 3000)
+
+            # Stream the document block by block into each target so the
+            # session buffer is never copied into one large Python string
+            for log_path, count in path_counts.items():
+                fh = self._get_log_handle(log_path)
+                for _ in range(count):
+                    self._stream_document_to_file(doc, fh)
+
+            if len(copied_names) == 1:
+                self._queue_status(status_message_signal, f"Content copied to {copied_names[0]}", 3000)
+            elif copied_names:
+                self._queue_status(status_message_signal, f"Content copied to {len(copied_names)} files", 3000)
 
         except Exception as e:
-            status_message_signal.emit(f"Log write error: {str(e)}", 5000)
+            self._queue_status(status_message_signal, f"Log write error: {str(e)}", 5000)
     
     def clear_node_log(self, selected_items, status_message_signal) -> None:
         """Clear the currently selected node's log file."""
         if not selected_items:
-            status_message_signal.emit("No item selected! Select a token or log file on the left.", 3000)
+            self._queue_status(status_message_signal, "No item selected! Select a token or log file on the left.", 3000)
             return
         item = selected_items[0]
         data = item.data(0, Qt.ItemDataRole.UserRole)
         if not data:
-            status_message_signal.emit("Selected item has no data", 3000)
+            self._queue_status(status_message_signal, "Selected item has no data", 3000)
             return
             
         try:
             if "log_path" in data:
                 log_path = data["log_path"]
-                # Clear the file
-                with open(log_path, 'w') as f:
-                    f.write("")
-                filename = os.path.basename(log_path)
-                status_message_signal.emit(f"Cleared log file: {filename}", 3000)
+                # Drop any buffered handle so its pending writes don't survive the clear
+                self._drop_log_handle(log_path)
+                # Truncate in place: one syscall, no file-object allocation
+                os.truncate(log_path, 0)
+                filename = log_path.rpartition(os.sep)[2]
+                self._queue_status(status_message_signal, f"Cleared log file: {filename}", 3000)
             elif "token" in data:
                 token_id = data["token"]
                 # Clear using the log_writer
                 self.log_writer.clear_log(token_id)
-                status_message_signal.emit(f"Cleared log for token: {token_id}", 3000)
+                self._queue_status(status_message_signal, f"Cleared log for token: {token_id}", 3000)
             else:
-                status_message_signal.emit("Unsupported item type", 3000)
+                self._queue_status(status_message_signal, "Unsupported item type", 3000)
         except Exception as e:
-            status_message_signal.emit(f"Error clearing log: {str(e)}", 5000)
+            self._queue_status(status_message_signal, f"Error clearing log: {str(e)}", 5000)
     
     def open_log_file(self, item: QTreeWidgetItem, column: int, status_message_signal) -> bool:
         """
@@ -140,14 +299,11 @@ class CommanderPresenterUtils:
             # All log items stored their path in "log_path"
             if "log_path" in data:
                 log_path = data["log_path"]
-                
-                # Use system default application to open the log file
-                try:
-                    os.startfile(log_path)  # Windows-specific
-                    status_message_signal.emit(f"Opened log file: {os.path.basename(log_path)}", 3000)
-                    return True
-                except Exception as e:
-                    status_message_signal.emit(f"Error opening file: {str(e)}", 5000)
+
+                # Dispatch to the global pool so association lookup cannot
+                # block the event loop; the runnable reports status itself
+                QThreadPool.globalInstance().start(
+                    _OpenLogFileRunnable(log_path, status_message_signal))
                 return True
         return False
     
@@ -162,6 +318,6 @@ class CommanderPresenterUtils:
             status_message_signal: Signal to emit status messages
         """
         if success_count == total_count:
-            status_message_signal.emit(f"Successfully processed {success_count} commands", 3000)
+            self._queue_status(status_message_signal, f"Successfully processed {success_count} commands", 3000)
         else:
-            status_message_signal.emit(f"Processed {success_count}/{total_count} commands successfully", 5000)
\ No newline at end of file
+            self._queue_status(status_message_signal, f"Processed {success_count}/{total_count} commands successfully", 5000)
\ No newline at end of file
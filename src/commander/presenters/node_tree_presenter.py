@@ -2,11 +2,13 @@
 Node Tree Presenter - Handles presentation logic for the node tree within the commander window
 """
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import logging
 import os
-import glob
+import re
 from typing import Optional
-from PyQt6.QtCore import QObject, pyqtSignal, Qt
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal, Qt
 from PyQt6.QtWidgets import QTreeWidgetItem
 
 from ..models import NodeToken
@@ -17,6 +19,67 @@ from ..command_queue import CommandQueue
 from ..services.fbc_command_service import FbcCommandService
 from ..services.rpc_command_service import RpcCommandService
 from ..icons import get_node_online_icon, get_node_offline_icon, get_token_icon
+from .commander_presenter_utils import report_error
+
+# Token extraction patterns, compiled once; these should match the ones
+# in CommanderWindow. Quantifiers are bounded so pathological filenames
+# cannot trigger runaway backtracking ([\w-] also matches '_', so the
+# segment separators are genuinely ambiguous to the engine).
+_FBC_TOKEN_RE = re.compile(r"^([\w-]{1,64})_[\d\.-]{1,64}_([\w-]{1,64})\.")
+_RPC_TOKEN_RE = re.compile(r"_([\d\w-]{1,64})\.[^.]{0,16}$")  # Matches last _token.extension
+_LIS_TOKEN_RE = re.compile(r"^([\w-]{1,64})_[\d-]{1,64}_([\d\w-]{1,64})\.lis$")
+
+# (section_type, dir_name, extensions) for the four lazy sections under
+# each node; a constant so node expansion allocates nothing per call
+_SECTION_SPEC = (
+    ("FBC", "FBC", ('.fbc', '.log', '.txt')),
+    ("RPC", "RPC", ('.rpc', '.log', '.txt')),
+    ("LOG", "LOG", ('.log',)),
+    ("LIS", "LIS", ('.lis',)),
+)
+
+
+@functools.lru_cache(maxsize=8192)
+def _extract_token_id_cached(filename, node_name, section_type):
+    """Extract token ID from filename based on section type
+
+    Pure function of its arguments, so results are memoized — repopulating
+    the tree rescans the same filenames and skips the regex work entirely.
+    """
+    if section_type == "LOG":
+        # Use the filename without extension as token ID
+        return os.path.splitext(filename)[0]
+
+    try:
+        if section_type == "FBC":
+            match = _FBC_TOKEN_RE.match(filename)
+            return match.group(2) if match and match.group(1) == node_name else None
+        elif section_type == "RPC":
+            match = _RPC_TOKEN_RE.search(filename)
+            return match.group(1) if match else None
+        elif section_type == "LIS":
+            match = _LIS_TOKEN_RE.match(filename)
+            return match.group(2) if match and match.group(1) == node_name else None
+    except (IndexError, AttributeError):
+        return None
+
+    return None
+
+
+class _TreeItem(QTreeWidgetItem):
+    """QTreeWidgetItem that takes its icon and UserRole payload at construction
+
+    Setting everything before the item is parented keeps the per-item Qt
+    crossings together and avoids model notifications for the setData call.
+    """
+    __slots__ = ()
+
+    def __init__(self, label, icon=None, payload=None):
+        super().__init__([label])
+        if icon is not None:
+            self.setIcon(0, icon)
+        if payload is not None:
+            self.setData(0, Qt.ItemDataRole.UserRole, payload)
 
 
 class NodeTreePresenter(QObject):
@@ -52,10 +115,39 @@ class NodeTreePresenter(QObject):
         self.fbc_service = fbc_service
         self.rpc_service = rpc_service
         self.context_menu_service = context_menu_service
-        
+        # Manual telnet connection shared with subgroup command batches;
+        # always assigned so hot paths can test it without getattr
+        self.active_telnet_client = None
+
+        # Directory listing cache keyed by (dir, prefix) and validated by mtime
+        self._dir_cache = {}
+        # Directory-existence cache, cleared per populate cycle; sections
+        # sharing a missing directory then cost one stat between them
+        self._isdir_cache = {}
+        # Extension that dominated the previous scan of each section type;
+        # trying it first lets endswith short-circuit on homogeneous dirs
+        self._ext_hits = {}
+        # Node objects snapshotted at populate time so expand handlers skip
+        # repeated manager lookups; rebuilt on every repopulation
+        self._node_cache = {}
+        # Interned per-file UserRole payloads; read-only after creation,
+        # so rebuilds can reuse the same dict object per path
+        self._payload_cache = {}
+        # Section scans are pure filesystem work, so they are prefetched on
+        # this pool as soon as a node expands; the four sibling directories
+        # are then read concurrently instead of one by one
+        self._io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="tree-scan")
+        self._section_futures = {}
+
+        # Single-shot timer coalescing rapid repopulation requests into one rebuild
+        self._repopulate_timer = QTimer(self)
+        self._repopulate_timer.setSingleShot(True)
+        self._repopulate_timer.setInterval(50)
+        self._repopulate_timer.timeout.connect(self.populate_node_tree)
+
         # Connect view signals to presenter methods
         self.view.item_expanded.connect(self.handle_item_expanded)
-        
+
         logging.debug("NodeTreePresenter initialized")
     
     def _report_error(self, message: str, exception: Optional[Exception] = None, duration: int = 5000):
@@ -67,9 +159,7 @@ class NodeTreePresenter(QObject):
             exception: Optional exception that occurred
             duration: Duration to display the message in milliseconds
         """
-        error_msg = f"{message}: {str(exception)}" if exception else message
-        logging.error(error_msg)
-        self.status_message_signal.emit(error_msg, duration)
+        report_error(self.status_message_signal, message, exception, duration)
         
     def populate_node_tree(self):
         """Lazy-loading tree population - only loads top-level nodes initially"""
@@ -78,32 +168,62 @@ class NodeTreePresenter(QObject):
         # This should be handled by the view, but we'll ensure it here
         self.node_tree_updated_signal.emit()
         
-        for node in self.node_manager.get_all_nodes():
-            node_item = self._create_node_item(node)
+        # Resolve the status icons once per rebuild; unknown statuses fall
+        # back to the offline icon
+        node_icons = {"online": get_node_online_icon()}
+        offline_icon = get_node_offline_icon()
+
+        # Snapshot the nodes once; expand handlers hit this dict instead of
+        # going back through the manager
+        nodes = self.node_manager.get_all_nodes()
+        self._node_cache = {node.name: node for node in nodes}
+        # Prefetched listings belong to the items just cleared
+        self._section_futures.clear()
+        self._isdir_cache.clear()
+
+        # One stat for the whole rebuild; the answer is the same for every node
+        log_root = self.node_manager.log_root
+        log_root_valid = bool(log_root and os.path.isdir(log_root))
+
+        # Build all node items first, then insert them in one call so Qt
+        # processes a single model change instead of one per node
+        node_items = []
+        for node in nodes:
+            node_item = self._create_node_item(node, node_icons, offline_icon, log_root_valid)
             if node_item:
                 # Add placeholder child that will trigger loading when expanded
-                placeholder = QTreeWidgetItem(["Click to load..."])
-                placeholder.setData(0, Qt.ItemDataRole.UserRole, {"node": node.name, "type": "placeholder"})
+                placeholder = _TreeItem("Click to load...",
+                                        payload={"node": node.name, "type": "placeholder"})
                 node_item.addChild(placeholder)
-                self.view.add_top_level_item(node_item)
+                node_items.append(node_item)
                 logging.debug(f"Added node with placeholder: {node.name}")
+
+        if node_items:
+            self.view.set_updates_enabled(False)
+            try:
+                self.view.add_top_level_items(node_items)
+            finally:
+                self.view.set_updates_enabled(True)
     
-    def _create_node_item(self, node):
+    def _get_cached_node(self, node_name):
+        """Look up a node from the populate-time snapshot, falling back to
+        the manager for nodes added since the last rebuild"""
+        node = self._node_cache.get(node_name)
+        if node is None:
+            node = self.node_manager.get_node(node_name)
+        return node
+
+    def _create_node_item(self, node, node_icons, offline_icon, log_root_valid):
         """Create node tree item with status icon"""
-        node_item = QTreeWidgetItem([f"{node.name} ({node.ip_address})"])
-        node_item.setIcon(0, get_node_online_icon() if node.status == "online"
-                         else get_node_offline_icon())
-        # Store node name in user data for later retrieval
-        node_item.setData(0, Qt.ItemDataRole.UserRole, {
-            "type": "node",
-            "node_name": node.name
-        })
-        
-        # Check log root
-        log_root = self.node_manager.log_root
-        if not log_root or not os.path.isdir(log_root):
-            no_folder = QTreeWidgetItem(["Please set log root folder"])
-            no_folder.setIcon(0, get_token_icon())  # Using token icon as warning icon
+        # Node name lives in the user data for later retrieval
+        node_item = _TreeItem(f"{node.name} ({node.ip_address})",
+                              icon=node_icons.get(node.status, offline_icon),
+                              payload={"type": "node", "node_name": node.name})
+
+        # Log root validity is checked once per rebuild by the caller
+        if not log_root_valid:
+            # Using token icon as warning icon
+            no_folder = _TreeItem("Please set log root folder", icon=get_token_icon())
             node_item.addChild(no_folder)
             return node_item
             
@@ -115,17 +235,30 @@ class NodeTreePresenter(QObject):
         data = item.data(0, Qt.ItemDataRole.UserRole)
         # Check if expanded item is a node with placeholder child
         if data and data.get("type") == "node":
-            # Find placeholder child (if exists)
-            for i in range(item.childCount()):
-                child = item.child(i)
-                child_data = child.data(0, Qt.ItemDataRole.UserRole)
-                if child_data and child_data.get("type") == "placeholder":
-                    item.removeChild(child)
-                    logging.debug(f"Removed placeholder for node: {item.text(0)}")
-                    self._load_node_children(item)
-                    break  # Only remove first placeholder found
+            self._consume_placeholder(item, "placeholder", self._load_node_children)
+        elif data and data.get("type") == "section":
+            # Sections load their file items on first expansion
+            self._consume_placeholder(item, "section_placeholder", self._load_section_children)
         else:
             logging.debug("Expanded item is not a node or has no placeholder")
+
+    def _consume_placeholder(self, item, placeholder_type, loader):
+        """Remove the lazy-load placeholder child and run the loader
+
+        Placeholders are always appended last at build time (usually as the
+        only child), so probing the first and last children is enough; an
+        already-loaded item fails both probes in constant time instead of
+        being rescanned child by child on every expand.
+        """
+        count = item.childCount()
+        for index in ((0, count - 1) if count else ()):
+            child = item.child(index)
+            child_data = child.data(0, Qt.ItemDataRole.UserRole)
+            if child_data and child_data.get("type") == placeholder_type:
+                item.takeChild(index)
+                logging.debug(f"Removed placeholder for: {item.text(0)}")
+                loader(item)
+                return
     
     def _load_node_children(self, node_item):
         """Load actual children for a node"""
@@ -137,171 +270,212 @@ class NodeTreePresenter(QObject):
             
         node_name = data["node_name"]
         logging.debug(f"_load_node_children: Loading children for node: {node_name}")
-        node = self.node_manager.get_node(node_name)
+        node = self._get_cached_node(node_name)
         if not node:
             logging.debug(f"_load_node_children: Node {node_name} not found")
             return
             
         added_sections = False
-        
-        # Create sections for each token type
-        sections = [
-            ("FBC", self._add_section("FBC", node, "FBC", ['.fbc', '.log', '.txt'])),
-            ("RPC", self._add_section("RPC", node, "RPC", ['.rpc', '.log', '.txt'])),
-            ("LOG", self._add_section("LOG", node, "LOG", ['.log'])),
-            ("LIS", self._add_section("LIS", node, "LIS", ['.lis']))
-        ]
-        
-        logging.debug(f"_load_node_children: Processing sections for node: {node.name}")
-        for section_type, section_data in sections:
-            logging.debug(f"_load_node_children: Processing {section_type} section")
-            logging.debug(f"_load_node_children: Section data: items={len(section_data['items'])}")
-            
-            # Always create the section item even if no files are found
-            section = QTreeWidgetItem([section_type])
-            section.setIcon(0, get_token_icon() if section_type in ("FBC", "RPC")
-                           else get_token_icon())
-            # Store node name in section item's user data for reliable access
-            section.setData(0, Qt.ItemDataRole.UserRole, {
+
+        # Create one lazy section per token type; the directory is only
+        # scanned when the section itself is first expanded
+        logging.debug(f"_load_node_children: Creating sections for node: {node.name}")
+        for section_type, dir_name, extensions in _SECTION_SPEC:
+            # Node name and scan parameters ride along for the deferred load
+            section = _TreeItem(section_type, icon=get_token_icon(), payload={
                 "node": node.name,
                 "type": "section",
-                "section_type": section_type
+                "section_type": section_type,
+                "dir_name": dir_name,
+                "extensions": extensions
             })
-            
-            if section_data["items"]:
-                logging.debug(f"_load_node_children: Adding {len(section_data['items'])} files to {section_type} section")
-                for item in section_data["items"]:
-                    section.addChild(item)
-                logging.debug(f"_load_node_children: Added {section_type} section with {section_data['count']} items")
-            else:
-                # Add placeholder text if no files found
-                placeholder = QTreeWidgetItem(["No files found"])
-                placeholder.setIcon(0, get_token_icon())
-                section.addChild(placeholder)
-                logging.debug(f"_load_node_children: No items found for {section_type} section")
-            
+
+            # Placeholder child that triggers the scan on expansion
+            placeholder = _TreeItem("Click to load...",
+                                    payload={"node": node.name, "type": "section_placeholder"})
+            section.addChild(placeholder)
+
             node_item.addChild(section)
             added_sections = True
-            logging.debug(f"_load_node_children: Added {section_type} subsection to node tree")
-        
+            # Kick off the directory scan now so the listing is usually
+            # ready by the time the user expands the section
+            self._section_futures[(node.name, section_type)] = self._io_pool.submit(
+                self._scan_section, section_type, node, dir_name, extensions)
+            logging.debug(f"_load_node_children: Added lazy {section_type} subsection")
+
         if not added_sections:
-            no_files = QTreeWidgetItem(["No files found for this node"])
-            no_files.setIcon(0, get_token_icon())
+            no_files = _TreeItem("No files found for this node", icon=get_token_icon())
             node_item.addChild(no_files)
             logging.debug(f"_load_node_children: No files found for node: {node_name}")
+
+    def _load_section_children(self, section_item):
+        """Load file items for a section on its first expansion"""
+        data = section_item.data(0, Qt.ItemDataRole.UserRole)
+        if not data or data.get("type") != "section":
+            logging.debug("_load_section_children: Item is not a section")
+            return
+
+        node = self._get_cached_node(data["node"])
+        if not node:
+            logging.debug(f"_load_section_children: Node {data['node']} not found")
+            return
+
+        section_type = data["section_type"]
+        future = self._section_futures.pop((node.name, section_type), None)
+        if future is not None:
+            found = future.result()
+        else:
+            found = self._scan_section(section_type, node, data["dir_name"], data["extensions"])
+        if found:
+            section_items = [
+                self._create_file_item(filename, file_path, node, token_id, section_type)
+                for filename, file_path, token_id in found
+            ]
+            section_item.addChildren(section_items)
+            logging.debug(f"_load_section_children: Added {len(section_items)} {section_type} items")
+        else:
+            placeholder = _TreeItem("No files found", icon=get_token_icon())
+            section_item.addChild(placeholder)
+            logging.debug(f"_load_section_children: No items found for {section_type} section")
         
-    def _add_section(self, section_type, node, dir_name, extensions):
-        """Add file items to section using glob patterns for efficiency"""
+    def _scan_section(self, section_type, node, dir_name, extensions):
+        """Collects (filename, file_path, token_id) tuples for one section
+
+        Pure filesystem work with no Qt object creation, so it is safe to
+        run on a worker thread.
+        """
         # For LOG files, directory is <log_root>/LOG/<node.name>
         # For others, it's <log_root>/<dir_name>/<node.name>
         if section_type == "LOG":
             section_dir = os.path.join(self.node_manager.log_root, "LOG")
         else:
             section_dir = os.path.join(self.node_manager.log_root, dir_name, node.name)
-            
-        items = []
-        
-        if not os.path.isdir(section_dir):
+
+        found = []
+
+        # Known-empty fast path: when the node carries no tokens of this
+        # type, the directory can only hold orphans, so skip the listing.
+        # LOG sections key off filenames rather than tokens, and nodes with
+        # no tokens at all still get scanned since files define them.
+        if section_type != "LOG" and node.tokens:
+            if (not node.tokens_by_type.get(section_type)
+                    and not any(t.token_type == section_type for t in node.tokens.values())):
+                logging.debug(f"No {section_type} tokens on node {node.name}; skipping scan")
+                return found
+
+        exists = self._isdir_cache.get(section_dir)
+        if exists is None:
+            exists = self._isdir_cache[section_dir] = os.path.isdir(section_dir)
+        if not exists:
             logging.debug(f"Directory not found: {section_dir}")
-            return {"items": items, "count": 0}
-            
-        # Process files matching patterns
-        for ext in extensions:
-            if section_type == "LOG":
-                pattern = os.path.join(section_dir, f"{node.name}_*.log")
-                logging.debug(f"LOG SECTION DEBUG: Scanning directory: {section_dir}")
-                logging.debug(f"LOG SECTION DEBUG: Using pattern: {pattern}")
+            return found
+
+        # List the directory once; DirEntry.is_file() reuses the data from
+        # the directory read, so no extra stat is issued per entry.
+        # Listings are cached by directory mtime so unchanged directories
+        # cost one stat instead of a readdir on repopulation.
+        prefix = f"{node.name}_"
+        cache_key = (section_dir, prefix)
+        try:
+            dir_mtime = os.stat(section_dir).st_mtime_ns
+            cached = self._dir_cache.get(cache_key)
+            if cached is not None and cached[0] == dir_mtime:
+                entries = cached[1]
             else:
-                pattern = os.path.join(section_dir, f"{node.name}_*{ext}")
-                
-            logging.debug(f"Scanning for {section_type} files with pattern: {pattern}")
-            files_found = glob.glob(pattern)
-            logging.debug(f"Found {len(files_found)} files matching pattern")
-            
-            for file_path in files_found:
-                filename = os.path.basename(file_path)
-                token_id = self._extract_token_id(filename, node.name, section_type)
-                
-                logging.debug(f"LOG SECTION DEBUG: Processing file: {filename} | Extracted token: {token_id}")
-                
-                if not token_id and section_type != "LOG":
-                    continue  # Skip invalid tokens except for LOG
-                    
-                file_item = self._create_file_item(
-                    filename, file_path, node,
-                    token_id, section_type
-                )
-                items.append(file_item)
-                logging.debug(f"Found {section_type} file: {filename}")
-                
-        logging.debug(f"Total {section_type} files found: {len(items)}")
-        if section_type == "LOG" and len(items) == 0:
+                with os.scandir(section_dir) as dir_entries:
+                    # Store the lowered name alongside so the suffix checks
+                    # below don't re-allocate it per extension
+                    entries = [
+                        (entry.name, entry.name.lower(), entry.path) for entry in dir_entries
+                        if entry.name.startswith(prefix) and entry.is_file(follow_symlinks=False)
+                    ]
+                self._dir_cache[cache_key] = (dir_mtime, entries)
+        except OSError as e:
+            logging.debug(f"Error scanning {section_dir}: {e}")
+            return found
+
+        # Single pass over the listing; endswith takes the whole suffix
+        # tuple so each filename is tested once instead of once per extension
+        suffixes = ('.log',) if section_type == "LOG" else tuple(extensions)
+        # Try last scan's dominant extension first so the common case
+        # short-circuits inside endswith
+        preferred = self._ext_hits.get(section_type)
+        if preferred in suffixes and suffixes[0] != preferred:
+            suffixes = (preferred,) + tuple(e for e in suffixes if e != preferred)
+        logging.debug(f"Scanning for {section_type} files with suffixes: {suffixes}")
+
+        ext_counts = {}
+        for filename, filename_lower, file_path in entries:
+            if not filename_lower.endswith(suffixes):
+                continue
+            token_id = self._extract_token_id(filename, node.name, section_type)
+
+            if not token_id and section_type != "LOG":
+                continue  # Skip invalid tokens except for LOG
+
+            found.append((filename, file_path, token_id))
+            ext = '.' + filename_lower.rpartition('.')[2]
+            ext_counts[ext] = ext_counts.get(ext, 0) + 1
+
+        if ext_counts:
+            self._ext_hits[section_type] = max(ext_counts, key=ext_counts.get)
+
+        logging.debug(f"Total {section_type} files found: {len(found)}")
+        if section_type == "LOG" and len(found) == 0:
             logging.warning("No LOG files found! Possible causes:")
             logging.warning(f"1. Directory doesn't exist: {section_dir}")
-            logging.warning(f"2. Pattern mismatch: {pattern}")
+            logging.warning(f"2. Prefix mismatch: {prefix}*.log")
             logging.warning(f"3. Token extraction failed for existing files")
-        return {"items": items, "count": len(items)}
+        return found
         
     def _extract_token_id(self, filename, node_name, section_type):
         """Extract token ID from filename based on section type"""
-        # These patterns should match the ones in CommanderWindow
-        FBC_TOKEN_PATTERN = r"^([\w-]+)_[\d\.-]+_([\w-]+)\."
-        RPC_TOKEN_PATTERN = r"_([\d\w-]+)\.[^.]*$"  # Matches last _token.extension
-        LIS_TOKEN_PATTERN = r"^([\w-]+)_[\d-]+_([\d\w-]+)\.lis$"
-        
-        if section_type == "LOG":
-            # Use the filename without extension as token ID
-            return os.path.splitext(filename)[0]
-            
-        try:
-            import re
-            if section_type == "FBC":
-                match = re.match(FBC_TOKEN_PATTERN, filename)
-                return match.group(2) if match and match.group(1) == node_name else None
-            elif section_type == "RPC":
-                match = re.search(RPC_TOKEN_PATTERN, filename)
-                return match.group(1) if match else None
-            elif section_type == "LIS":
-                match = re.match(LIS_TOKEN_PATTERN, filename)
-                return match.group(2) if match and match.group(1) == node_name else None
-        except (IndexError, AttributeError):
-            return None
-            
-        return None
+        return _extract_token_id_cached(filename, node_name, section_type)
         
     def _create_file_item(self, filename, file_path, node, token_id, token_type):
         """Create standardized file tree item"""
-        file_item = QTreeWidgetItem([f" {filename}"])
-        file_extension = os.path.splitext(file_path)[1][1:].upper()
-        resolved_type = file_extension if file_extension in {'FBC','RPC','LOG','LIS'} else token_type
-        
-        file_item.setData(0, Qt.ItemDataRole.UserRole, {
-            "log_path": file_path,
-            "token": token_id,
-            "token_type": resolved_type,
-            "node": node.name,
-            "ip_address": node.ip_address
-        })
-        file_item.setIcon(0, get_token_icon())
-        return file_item
+        payload = self._payload_cache.get(file_path)
+        if payload is None:
+            # rpartition beats splitext here: one reverse scan, no path
+            # normalization, and these names always carry an extension
+            file_extension = file_path.rpartition('.')[2].upper()
+            resolved_type = file_extension if file_extension in {'FBC','RPC','LOG','LIS'} else token_type
+            payload = {
+                "log_path": file_path,
+                "token": token_id,
+                "token_type": resolved_type,
+                "node": node.name,
+                "ip_address": node.ip_address
+            }
+            self._payload_cache[file_path] = payload
+
+        return _TreeItem(f" {filename}", icon=get_token_icon(), payload=payload)
         
+    def request_repopulate(self):
+        """Schedule a tree rebuild, coalescing bursts into a single pass"""
+        self._repopulate_timer.start()
+
     def set_log_root_folder(self, folder_path):
         """Set the root folder for log files"""
         # This method is called by the view when the user selects a folder
         if folder_path:
+            self._dir_cache.clear()
+            self._payload_cache.clear()
             self.node_manager.set_log_root(folder_path)
             self.node_manager.scan_log_files()
-            self.populate_node_tree()
+            self.request_repopulate()
             self.status_message_signal.emit("Log root folder set successfully", 3000)
         
     def load_configuration(self, file_path):
         """Load node configuration from selected file"""
         # This method is called by the view when the user selects a configuration file
         if file_path:
+            self._dir_cache.clear()
+            self._payload_cache.clear()
             self.node_manager.set_config_path(file_path)
             if self.node_manager.load_configuration():
                 self.node_manager.scan_log_files()
-                self.populate_node_tree()
+                self.request_repopulate()
                 self.status_message_signal.emit("Configuration loaded successfully", 3000)
             else:
                 self.status_message_signal.emit("Error loading node configuration", 5000)
@@ -351,27 +525,38 @@ class NodeTreePresenter(QObject):
         if not node_item:
             self._report_error(f"Section {section_item.text(0)} has no parent node")
             return
-        node_name = node_item.text(0).split(' ', 1)[0].strip()
+        # The node name is stored in the item's user data; parsing the
+        # display text would break for names containing spaces
+        node_data = node_item.data(0, Qt.ItemDataRole.UserRole)
+        if isinstance(node_data, dict) and "node_name" in node_data:
+            node_name = node_data["node_name"]
+        else:
+            node_name = node_item.text(0).split(' ', 1)[0].strip()
         
         node = self.node_manager.get_node(node_name)
         if not node:
             self.status_message_signal.emit(f"Node {node_name} not found", 3000)
             return
             
-        # Find all FBC tokens in the node
-        fbc_tokens = [t for t in node.tokens.values() if t.token_type == "FBC"]
+        # Per-type index avoids scanning every token; fall back to the scan
+        # for nodes whose tokens dict was assigned without going through
+        # add_token
+        fbc_tokens = (node.tokens_by_type.get("FBC")
+                      or [t for t in node.tokens.values() if t.token_type == "FBC"])
         if not fbc_tokens:
             self.status_message_signal.emit(f"No FBC tokens found in node {node_name}", 3000)
             return
             
         self.status_message_signal.emit(f"Processing {len(fbc_tokens)} FBC tokens in node {node_name}...", 0)
         
-        # Process each FBC token
-        for token in fbc_tokens:
-            # Pass active telnet client for reuse if available
-            telnet_client = getattr(self, 'active_telnet_client', None)
-            self.fbc_service.queue_fieldbus_command(node_name, token.token_id, telnet_client)
-            
+        # Pass active telnet client for reuse if available
+        telnet_client = self.active_telnet_client
+
+        # Enqueue the whole batch in one service call so the queue is
+        # started once instead of once per token
+        self.fbc_service.queue_fieldbus_commands(
+            node_name, [token.token_id for token in fbc_tokens], telnet_client)
+
         # Start processing the queue
         self.command_queue.start_processing()
         self.status_message_signal.emit(f"Queued {len(fbc_tokens)} commands for node {node_name}", 3000)
@@ -396,15 +581,24 @@ class NodeTreePresenter(QObject):
         if not node_item:
             self._report_error(f"Section {section_item.text(0)} has no parent node")
             return
-        node_name = node_item.text(0).split(' ', 1)[0].strip()
+        # The node name is stored in the item's user data; parsing the
+        # display text would break for names containing spaces
+        node_data = node_item.data(0, Qt.ItemDataRole.UserRole)
+        if isinstance(node_data, dict) and "node_name" in node_data:
+            node_name = node_data["node_name"]
+        else:
+            node_name = node_item.text(0).split(' ', 1)[0].strip()
         
         node = self.node_manager.get_node(node_name)
         if not node:
             self.status_message_signal.emit(f"Node {node_name} not found", 3000)
             return
             
-        # Find all RPC tokens in the node
-        rpc_tokens = [t for t in node.tokens.values() if t.token_type == "RPC"]
+        # Per-type index avoids scanning every token; fall back to the scan
+        # for nodes whose tokens dict was assigned without going through
+        # add_token
+        rpc_tokens = (node.tokens_by_type.get("RPC")
+                      or [t for t in node.tokens.values() if t.token_type == "RPC"])
         if not rpc_tokens:
             self.status_message_signal.emit(f"No RPC tokens found in node {node_name}", 3000)
             return
@@ -412,12 +606,15 @@ class NodeTreePresenter(QObject):
         self.status_message_signal.emit(f"Processing {len(rpc_tokens)} RPC tokens in node {node_name}...", 0)
         
         # Pass active telnet client for reuse if available
-        telnet_client = getattr(self, 'active_telnet_client', None)
-        
-        # Queue commands for all RPC tokens using service method
-        for token in rpc_tokens:
-            self.rpc_service.queue_rpc_command(node_name, token.token_id, "print", telnet_client)
-            
+        telnet_client = self.active_telnet_client
+
+        # Enqueue the whole batch in one service call so the queue is
+        # started once instead of once per token
+        self.rpc_service.queue_rpc_commands(
+            node_name, [token.token_id for token in rpc_tokens], "print", telnet_client)
+
+        # Start processing the queue
+        self.command_queue.start_processing()
         self.status_message_signal.emit(f"Queued {len(rpc_tokens)} commands for node {node_name}", 3000)
         
     def process_fieldbus_command(self, token_id, node_name):
@@ -438,7 +635,7 @@ class NodeTreePresenter(QObject):
             self.status_message_signal.emit(f"Executing: {command}...", 3000)
             
             # Pass active telnet client for reuse
-            telnet_client = getattr(self, 'active_telnet_client', None)
+            telnet_client = self.active_telnet_client
             self.fbc_service.queue_fieldbus_command(node_name, token_id, telnet_client)
             self.command_queue.start_processing()
         except ValueError as e:
@@ -467,7 +664,8 @@ class NodeTreePresenter(QObject):
                 raise ValueError("Invalid token ID")
                 
             # Extract token part from token_id (format: NODE_TOKEN)
-            token_part = token_id.split('_')[-1] if '_' in token_id else token_id
+            # rpartition returns the whole string when no '_' is present
+            token_part = token_id.rpartition('_')[2]
             
             # Validate token
             token = self.rpc_service.get_token(node_name, token_part)
@@ -476,7 +674,7 @@ class NodeTreePresenter(QObject):
                 return
             
             # Pass active telnet client for reuse
-            telnet_client = getattr(self, 'active_telnet_client', None)
+            telnet_client = self.active_telnet_client
             
             # Queue command through service
             self.rpc_service.queue_rpc_command(node_name, token_part, action_type, telnet_client)
@@ -99,20 +99,4 @@ class SessionPresenter(QObject):
             self.update_connection_status_signal.emit(ConnectionState.DISCONNECTED)
         except Exception as e:
             # Still reset UI state even if disconnection failed
-            self.update_connection_status_signal.emit(ConnectionState.DISCONNECTED)
-    
-    def set_telnet_session(self, session):
-        """Set the telnet session"""
-        self.telnet_session = session
-    
-    def get_telnet_session(self):
-        """Get the telnet session"""
-        return self.telnet_session
-    
-    def set_active_telnet_client(self, client):
-        """Set the active telnet client"""
-        self.active_telnet_client = client
-    
-    def get_active_telnet_client(self):
-        """Get the active telnet client"""
-        return self.active_telnet_client
\ No newline at end of file
+            self.update_connection_status_signal.emit(ConnectionState.DISCONNECTED)
\ No newline at end of file
@@ -4,18 +4,19 @@ import sys
 
 def initialize_qt():
     """Initialize Qt application instance and set up environment"""
-    # Set up Qt environment variables
-    os.environ["QT_LOGGING_RULES"] = "qt.core.filesystemwatcher=false"
-    os.environ["QT_AUTO_SCREEN_SCALE_FACTOR"] = "0"
-    if "QT_QPA_PLATFORM" not in os.environ:
-        os.environ["QT_QPA_PLATFORM"] = "windows:darkmode=0"  # Default to windows platform
-    
-    # Only create application if required
+    # Check for CLI/headless mode first so those paths skip the GUI
+    # environment writes entirely
     if "--cli" in sys.argv or not have_gui():
         # Command-line mode or headless environment
         os.environ["QT_QPA_PLATFORM"] = "minimal"
         return None
-    
+
+    # Set up Qt environment variables (GUI path only)
+    os.environ["QT_LOGGING_RULES"] = "qt.core.filesystemwatcher=false"
+    os.environ["QT_AUTO_SCREEN_SCALE_FACTOR"] = "0"
+    if "QT_QPA_PLATFORM" not in os.environ:
+        os.environ["QT_QPA_PLATFORM"] = "windows:darkmode=0"  # Default to windows platform
+
     # Create QApplication if it doesn't exist
     try:
         from PyQt6.QtWidgets import QApplication
@@ -25,8 +26,19 @@ def initialize_qt():
         pass
     return None
 
+_HAVE_GUI = None
+
+
 def have_gui():
-    """Check if we're in a GUI-capable environment"""
+    """Check if we're in a GUI-capable environment (memoized)"""
+    global _HAVE_GUI
+    if _HAVE_GUI is None:
+        _HAVE_GUI = _detect_gui()
+    return _HAVE_GUI
+
+
+def _detect_gui():
+    """Probe the environment for GUI capability"""
     # For build environments like PyInstaller that set _MEIPASS
     if hasattr(sys, 'frozen') and hasattr(sys, '_MEIPASS'):
         return False
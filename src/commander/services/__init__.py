@@ -1,11 +1,25 @@
 """Services Module for Commander Application"""
 
-from .context_menu_filter import ContextMenuFilterService
-from .fbc_command_service import FbcCommandService
-from .rpc_command_service import RpcCommandService
-
-__all__ = [
-    'ContextMenuFilterService',
-    'FbcCommandService',
-    'RpcCommandService'
-]
\ No newline at end of file
+import importlib
+
+# Lazy re-exports (PEP 562): the service modules are only imported when a
+# name is first referenced, keeping package import cheap for entry points
+# that use a subset of the services
+_LAZY = {
+    'ContextMenuFilterService': '.context_menu_filter',
+    'FbcCommandService': '.fbc_command_service',
+    'RpcCommandService': '.rpc_command_service',
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(module_name, __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
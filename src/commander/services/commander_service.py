@@ -8,7 +8,9 @@ from ..session_manager import SessionManager
 from ..services.logging_service import LoggingService
 import logging
 import os
-from PyQt6.QtCore import pyqtSignal, QObject
+from PyQt6.QtCore import pyqtSignal, QObject, QTimer
+
+logger = logging.getLogger(__name__)
 
 
 class CommanderService(QObject):
@@ -53,7 +55,35 @@ class CommanderService(QObject):
         self.command_queue.command_completed.connect(self._handle_queued_command_result)
         self.command_queue.command_completed.connect(self._log_command_result)
         self.command_queue.progress_updated.connect(self.queue_processed)
-        
+
+        # Throttle per-command status updates so bulk completions repaint
+        # the status bar at most every 80 ms instead of once per command
+        self._pending_status = None
+        self._status_throttle = QTimer(self)
+        self._status_throttle.setInterval(80)
+        self._status_throttle.setSingleShot(True)
+        self._status_throttle.timeout.connect(self._flush_throttled_status)
+
+    def _emit_status_throttled(self, message: str, duration: int):
+        """Emit a status message, coalescing bursts to one emit per interval
+
+        Leading edge goes out immediately; anything arriving while the
+        timer runs only keeps the latest message, emitted on timeout.
+        """
+        if self._status_throttle.isActive():
+            self._pending_status = (message, duration)
+        else:
+            self.status_message.emit(message, duration)
+            self._status_throttle.start()
+
+    def _flush_throttled_status(self):
+        """Emit the trailing status message held back by the throttle"""
+        if self._pending_status is not None:
+            message, duration = self._pending_status
+            self._pending_status = None
+            self.status_message.emit(message, duration)
+            self._status_throttle.start()
+
     def process_fieldbus_command(self, token_id, node_name):
         """Process fieldbus command with optimized error handling"""
         try:
@@ -70,7 +100,7 @@ class CommanderService(QObject):
             # Just emit the error message
             self.status_message.emit(str(e), 3000)
         except Exception as e:
-            logging.error(f"Error processing fieldbus command: {e}")
+            logging.error("Error processing fieldbus command: %s", e)
             self.status_message.emit(f"Error: {str(e)}", 5000)
             
     def process_rpc_command(self, node_name, token_id, action_type):
@@ -81,18 +111,20 @@ class CommanderService(QObject):
         except ValueError as e:
             self.status_message.emit(str(e), 3000)
         except Exception as e:
-            logging.error(f"Error processing RPC command: {e}")
+            logging.error("Error processing RPC command: %s", e)
             self.status_message.emit(f"Error: {str(e)}", 5000)
             
     def _handle_queued_command_result(self, command: str, result: str, success: bool, token=None):
         """Handle completed commands from the queue and log results"""
-        logging.debug(f"_handle_queued_command_result: command={command}, success={success}, result_length={len(result)}")
+        # %-style args defer formatting until the logger accepts the record
+        logger.debug("_handle_queued_command_result: command=%s, success=%s, result_length=%d",
+                     command, success, len(result))
         if success:
-            self.status_message.emit(f"Command succeeded: {command}", 3000)
-            logging.info(f"Command completed successfully: {command}\nResult: {result}")
+            self._emit_status_throttled(f"Command succeeded: {command}", 3000)
+            logger.info("Command completed successfully: %s\nResult: %s", command, result)
         else:
-            self.status_message.emit(f"Command failed: {command} - {result}", 5000)
-            logging.error(f"Command failed: {command}\nError: {result}")
+            self._emit_status_throttled(f"Command failed: {command} - {result}", 5000)
+            logger.error("Command failed: %s\nError: %s", command, result)
             
     def _log_command_result(self, command: str, result: str, success: bool, token=None):
         """Log command results to the appropriate log file"""
@@ -1,10 +1,75 @@
 """Service for managing context menu filtering rules."""
 import json
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Pattern, Union
+from typing import Dict, List, Optional, Pattern, Tuple, Union
 import re
 
+# Parsed (and compiled) rule lists shared across instances, keyed by
+# resolved config path and guarded by the file's mtime
+_RULES_CACHE: Dict[Path, Tuple[float, List[Dict]]] = {}
+# Paths whose default config this process has already written
+_DEFAULTS_WRITTEN = set()
+
+
+def _compile_pattern(pattern: Optional[Union[str, List[str]]]) -> Optional[Tuple[frozenset, List[Pattern]]]:
+    """
+    Translate a rule pattern into a precompiled matcher.
+
+    Rule patterns are fixed at load time, so the wildcard translation and
+    regex compilation happen once here instead of on every menu popup.
+
+    Args:
+        pattern: Pattern from a rule (string, list of strings, or None)
+
+    Returns:
+        None for match-anything patterns, otherwise a (literals, regexes)
+        pair: a frozenset of exact strings and a list of compiled regexes
+    """
+    if pattern is None:
+        return None
+
+    items = pattern if isinstance(pattern, list) else [pattern]
+    literals = set()
+    regexes = []
+    for item in items:
+        if not isinstance(item, str):
+            continue
+        # Exact match is always tried first, so the raw string stays a literal
+        literals.add(item)
+        # Wildcard match (* and ?)
+        if '*' in item or '?' in item:
+            regex = item.replace('.', '\\.').replace('*', '.*').replace('?', '.')
+            regexes.append(re.compile(f"^{regex}$"))
+        # Regex match (surrounded by /)
+        elif item.startswith('/') and item.endswith('/'):
+            try:
+                regexes.append(re.compile(item[1:-1]))
+            except re.error:
+                logging.warning(f"Invalid regex pattern: {item}")
+    return frozenset(literals), regexes
+
+
+def _exact_key(compiled: Dict) -> Optional[Tuple[str, str, str, str]]:
+    """
+    Return the rule's four field values as an index key, or None.
+
+    A rule is exact-indexable only when every field is a single literal
+    string with no wildcard or regex alternatives.
+    """
+    key = []
+    for field in ('node_name', 'section_type', 'command_type', 'command_category'):
+        matcher = compiled[field]
+        if matcher is None:
+            return None
+        literals, regexes = matcher
+        if regexes or len(literals) != 1:
+            return None
+        key.append(next(iter(literals)))
+    return tuple(key)
+
+
 class ContextMenuFilterService:
     """Service for managing context menu filtering rules based on configuration."""
     
@@ -17,26 +82,73 @@ class ContextMenuFilterService:
         """
         self.config_path = Path(config_path)
         self.rules = []
+        self._exact_index = {}
+        self._pattern_rules = []
         self._load_rules()
     
     def _load_rules(self) -> None:
         """Load filtering rules from configuration file."""
+        self._invalidate_cache()
         try:
             if not self.config_path.exists():
                 logging.warning(f"Filter configuration file not found: {self.config_path}")
-                # Create default configuration
-                self._create_default_config()
+                # Create default configuration, once per path per process
+                resolved = self.config_path.resolve()
+                if resolved not in _DEFAULTS_WRITTEN:
+                    _DEFAULTS_WRITTEN.add(resolved)
+                    self._create_default_config()
                 return
-                
+
+            resolved = self.config_path.resolve()
+            mtime = self.config_path.stat().st_mtime
+            cached = _RULES_CACHE.get(resolved)
+            if cached is not None and cached[0] == mtime:
+                # File unchanged since another instance parsed it; reuse
+                # the parsed and compiled rule list
+                self.rules = cached[1]
+                self._index_rules()
+                return
+
             with open(self.config_path, 'r', encoding='utf-8') as f:
                 config = json.load(f)
-                
+
             self.rules = config.get('rules', [])
+            self._compile_rules()
+            _RULES_CACHE[resolved] = (mtime, self.rules)
             logging.info(f"Loaded {len(self.rules)} context menu filtering rules from {self.config_path}")
-            
+
         except Exception as e:
             logging.error(f"Failed to load menu filter rules: {e}")
             self.rules = []
+            self._index_rules()
+
+    def _compile_rules(self) -> None:
+        """Precompile the pattern fields of every loaded rule."""
+        for rule in self.rules:
+            rule['_compiled'] = {
+                'node_name': _compile_pattern(rule.get('node_name')),
+                'section_type': _compile_pattern(rule.get('section_type')),
+                'command_type': _compile_pattern(rule.get('command_type', 'all')),
+                'command_category': _compile_pattern(rule.get('command_category', 'all')),
+            }
+        self._index_rules()
+
+    def _index_rules(self) -> None:
+        """Partition rules into an exact-key index and a pattern bucket.
+
+        All-literal rules dispatch through a dict keyed on the four field
+        values; only wildcard/regex/list/None rules stay in the linear
+        scan. Positions are kept so first-match precedence survives.
+        """
+        self._exact_index = {}
+        self._pattern_rules = []
+        for position, rule in enumerate(self.rules):
+            key = _exact_key(rule['_compiled'])
+            if key is not None:
+                # First matching rule wins, so keep the earliest entry
+                self._exact_index.setdefault(key, (position, rule))
+            else:
+                self._pattern_rules.append((position, rule))
     
     def _create_default_config(self) -> None:
         """Create a default configuration file with common filtering rules."""
@@ -93,25 +205,49 @@ class ContextMenuFilterService:
         Returns:
             True if command should be shown, False otherwise
         """
-        # Default to showing commands
-        show = True
-        
-        for rule in self.rules:
+        # Results are deterministic for a given rule set and the same few
+        # tuples recur on every right-click, so delegate to the memoized
+        # evaluator
+        return self._should_show_command_cached(
+            node_name, section_type, command_type, command_category)
+
+    @lru_cache(maxsize=512)
+    def _should_show_command_cached(self,
+                                    node_name: str,
+                                    section_type: str,
+                                    command_type: str,
+                                    command_category: str) -> bool:
+        """Evaluate the rule list for one context tuple (memoized)."""
+        if self.rules and not self._exact_index and not self._pattern_rules:
+            # Rules assigned directly (bypassing _load_rules) compile lazily
+            self._compile_rules()
+
+        # All-literal rules resolve through the index in one lookup
+        match = self._exact_index.get(
+            (node_name, section_type, command_type, command_category))
+
+        # A pattern rule earlier in the list still outranks an exact hit,
+        # so scan the (usually tiny) pattern bucket up to its position
+        for position, rule in self._pattern_rules:
+            if match is not None and position > match[0]:
+                break
             try:
-                # Check if rule applies to this context
                 if self._rule_matches(rule, node_name, section_type, command_type, command_category):
-                    action = rule.get('action', 'show').lower()
-                    if action == 'hide':
-                        show = False
-                    elif action == 'show':
-                        show = True
+                    match = (position, rule)
                     break  # First matching rule takes precedence
-                    
             except Exception as e:
                 logging.error(f"Error evaluating filter rule: {e}")
                 continue
-                
-        return show
+
+        if match is None:
+            # Default to showing commands
+            return True
+        return match[1].get('action', 'show').lower() != 'hide'
+
+    def _invalidate_cache(self) -> None:
+        """Drop memoized visibility results after the rule set changes."""
+        # lru_cache lives on the class, so clear through the class attribute
+        ContextMenuFilterService._should_show_command_cached.cache_clear()
 
     def is_visible(self, section_type: str, node_name: str) -> bool:
         """
@@ -149,63 +285,42 @@ class ContextMenuFilterService:
         Returns:
             True if rule matches, False otherwise
         """
+        compiled = rule.get('_compiled')
+        if compiled is None:
+            # Rules assigned directly (bypassing _load_rules) compile lazily
+            self._compile_rules()
+            compiled = rule['_compiled']
+
         # Check node name (exact match or pattern)
-        node_match = self._matches_pattern(node_name, rule.get('node_name'))
-        if not node_match:
+        if not self._matches_pattern(node_name, compiled['node_name']):
             return False
-            
+
         # Check section type (exact match or pattern)
-        section_match = self._matches_pattern(section_type, rule.get('section_type'))
-        if not section_match:
+        if not self._matches_pattern(section_type, compiled['section_type']):
             return False
-            
+
         # Check command type (exact match or pattern)
-        cmd_match = self._matches_pattern(command_type, rule.get('command_type', 'all'))
-        if not cmd_match:
+        if not self._matches_pattern(command_type, compiled['command_type']):
             return False
-            
-            
+
         # Check command category (exact match or pattern)
-        category_match = self._matches_pattern(command_category, rule.get('command_category', 'all'))
-        if not category_match:
+        if not self._matches_pattern(command_category, compiled['command_category']):
             return False
-            
+
         return True
-    
-    def _matches_pattern(self, value: str, pattern: Optional[Union[str, List[str]]]) -> bool:
+
+    def _matches_pattern(self, value: str, compiled: Optional[Tuple[frozenset, List[Pattern]]]) -> bool:
         """
-        Check if a value matches a pattern (exact, wildcard, or regex).
-        
+        Check if a value matches a precompiled pattern.
+
         Args:
             value: Value to check
-            pattern: Pattern to match against (string, list of strings, or None)
-            
+            compiled: Matcher built by _compile_pattern, or None for any
+
         Returns:
             True if value matches pattern, False otherwise
         """
-        if pattern is None:
+        if compiled is None:
             return True
-            
-        if isinstance(pattern, list):
-            return any(self._matches_pattern(value, p) for p in pattern)
-            
-        if isinstance(pattern, str):
-            # Exact match
-            if pattern == value:
-                return True
-                
-            # Wildcard match (* and ?)
-            if '*' in pattern or '?' in pattern:
-                regex = pattern.replace('.', '\\.').replace('*', '.*').replace('?', '.')
-                return bool(re.match(f"^{regex}$", value))
-                
-            # Regex match (surrounded by /)
-            if pattern.startswith('/') and pattern.endswith('/'):
-                try:
-                    regex = pattern[1:-1]
-                    return bool(re.match(regex, value))
-                except re.error:
-                    logging.warning(f"Invalid regex pattern: {pattern}")
-                    return False
-                    
-        return False
\ No newline at end of file
+        literals, regexes = compiled
+        return value in literals or any(p.match(value) for p in regexes)
\ No newline at end of file
@@ -127,7 +127,7 @@ class ContextMenuService:
                     ):
                         logging.debug(f"Context menu filtered out RPC token command for {token_id}")
                     else:
-                        display_token = token_id.split('_')[-1] if '_' in token_id else token_id
+                        display_token = token_id.rpartition('_')[2]
                         print_action = QAction(f"Print Rupi counters Token '{display_token}'", menu)
                         clear_action = QAction(f"Clear Rupi counters '{display_token}'", menu)
                         if self.presenter:
@@ -210,7 +210,8 @@ class ContextMenuService:
         """
         if self.presenter:
             # Use presenter method instead of window method
-            token_part = token_id.split('_')[-1] if '_' in token_id else token_id
+            # rpartition returns the whole string when no '_' is present
+            token_part = token_id.rpartition('_')[2]
             self.presenter.process_rpc_command(node_name, token_id, action_type)
     
     def get_node_tokens(self, node_name: str, token_type: str) -> List[NodeToken]:
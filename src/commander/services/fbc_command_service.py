@@ -21,12 +21,19 @@ class FbcCommandService(QObject):
         self.command_queue = command_queue
         self.log_writer = log_writer
         self.logger = logging.getLogger(__name__)
-        
-    
+        # Command text is a pure function of the token ID; memoize so
+        # repeated subgroup processing reuses the same string
+        self._cmd_cache = {}
+
+
     def generate_fieldbus_command(self, token_id: str) -> str:
         """Generate FBC command text for a token ID"""
-        normalized_token = self.normalize_token(token_id)
-        return f"print from fbc io structure {normalized_token}0000"
+        command = self._cmd_cache.get(token_id)
+        if command is None:
+            normalized_token = self.normalize_token(token_id)
+            command = f"print from fbc io structure {normalized_token}0000"
+            self._cmd_cache[token_id] = command
+        return command
     
     def normalize_token(self, token_id: str) -> str:
         """Normalize token ID to 3-digit format"""
@@ -93,7 +100,8 @@ class FbcCommandService(QObject):
             
             command = self.generate_fieldbus_command(token_id)
             self.logger.debug(f"FbcCommandService.queue_fieldbus_command: Generated command: {command}")
-            self.logger.debug(f"FbcCommandService.queue_fieldbus_command: Full token details: {vars(token)}")
+            # NodeToken is slotted, so use its dataclass repr instead of vars()
+            self.logger.debug(f"FbcCommandService.queue_fieldbus_command: Full token details: {token!r}")
             
             # Emit signals to update UI
             self.logger.debug("FbcCommandService.queue_fieldbus_command: Emitting UI update signals")
@@ -109,3 +117,40 @@ class FbcCommandService(QObject):
             self.logger.error(f"Error queuing FBC command: {str(e)}", exc_info=False)
             self.report_error.emit(f"Error queuing command: {str(e)}")
             self.status_message.emit(f"Error queuing command: {str(e)}", 5000)
+
+    def queue_fieldbus_commands(self, node_name: str, token_ids, telnet_client=None):
+        """Queue FBC commands for a batch of tokens with one processing start
+
+        Commands are enqueued with auto_start disabled so the queue starts
+        once for the whole batch instead of once per token, and the UI
+        signals fire once rather than per command.
+        """
+        self.logger.info(f"FbcCommandService.queue_fieldbus_commands: Queuing {len(token_ids)} commands for node '{node_name}'")
+        # Coalesce progress into one emission when this batch drains
+        self.command_queue.defer_taskrun = True
+        command = None
+        queued = 0
+        for token_id in token_ids:
+            # One bad token skips only itself, as in the per-token API
+            try:
+                token = self.get_token(node_name, token_id)
+
+                # Ensure log file is initialized before queuing command
+                self._initialize_log_file(token)
+
+                command = self.generate_fieldbus_command(token_id)
+                self.command_queue.add_command(command, token, telnet_client, auto_start=False)
+                queued += 1
+            except Exception as e:
+                self.logger.error(f"Error queuing FBC command for token {token_id}: {str(e)}", exc_info=False)
+                self.report_error.emit(f"Error queuing command: {str(e)}")
+                self.status_message.emit(f"Error queuing command: {str(e)}", 5000)
+
+        if queued == 0:
+            return
+
+        # Emit signals to update UI once for the batch
+        self.set_command_text.emit(command)
+        self.switch_to_telnet_tab.emit()
+        self.focus_command_input.emit()
+        self.status_message.emit(f"Queued {queued} FBC commands for node {node_name}", 3000)
@@ -3,12 +3,42 @@ Logging Service - Handles all logging operations for the Commander application
 """
 import logging
 import os
+import queue
+import threading
 from typing import Optional
 from ..models import NodeToken
 from ..log_writer import LogWriter
 from ..node_manager import NodeManager
 
 
+class _LogWriteWorker:
+    """Single background thread that drains queued log writes in order
+
+    Keeps disk I/O for command output off the Qt main thread; a plain
+    FIFO preserves append ordering per log file.
+    """
+
+    def __init__(self):
+        self._queue = queue.SimpleQueue()
+        self._thread = None
+
+    def submit(self, task):
+        """Queue a write task, starting the worker thread on first use"""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="log-write", daemon=True)
+            self._thread.start()
+        self._queue.put(task)
+
+    def _run(self):
+        while True:
+            task = self._queue.get()
+            try:
+                task()
+            except Exception as e:
+                logging.error(f"Log write worker error: {str(e)}")
+
+
 class LoggingService:
     """Service for handling logging operations"""
     
@@ -27,7 +57,30 @@ class LoggingService:
         """
         self.node_manager = node_manager
         self.log_writer = log_writer
+        self._write_worker = _LogWriteWorker()
+        # Resolved (log_path, basename) per (token_id, token_type);
+        # NodeToken is slotted, so the cache lives here rather than on
+        # the token object
+        self._log_path_cache = {}
         logging.debug("LoggingService initialized")
+
+    def _write_log_async(self, write, success_message, status_message_signal):
+        """
+        Run a log write on the writer thread and report its outcome.
+
+        The status signal is emitted from the worker; Qt delivers it to the
+        GUI thread through a queued connection.
+        """
+        def task():
+            try:
+                write()
+                if status_message_signal and success_message:
+                    status_message_signal.emit(success_message, self.STATUS_MSG_SHORT)
+            except Exception as e:
+                logging.error(f"Log write failed: {str(e)}")
+                if status_message_signal:
+                    status_message_signal.emit(f"Log write failed: {str(e)}", self.STATUS_MSG_MEDIUM)
+        self._write_worker.submit(task)
     
     def report_error(self, message: str, exception: Exception | None = None, duration: int | None = None):
         """
@@ -39,9 +92,13 @@ class LoggingService:
             duration: Duration to display message (milliseconds)
         """
         duration = duration or self.STATUS_MSG_MEDIUM
-        error_msg = f"{message}: {str(exception)}" if exception else message
-        logging.error(error_msg)
-        logging.error(error_msg)  # Duplicate logging as in original
+        # %-style args defer formatting until the logger accepts the record
+        if exception is not None:
+            logging.error("%s: %s", message, exception)
+            logging.error("%s: %s", message, exception)  # Duplicate logging as in original
+        else:
+            logging.error(message)
+            logging.error(message)  # Duplicate logging as in original
         
     def handle_fbc_error(self, error_msg: str):
         """
@@ -62,11 +119,14 @@ class LoggingService:
             success: Whether the command succeeded
             token: Token associated with the command
         """
-        logging.debug(f"_handle_queued_command_result: command={command}, success={success}, result_length={len(result)}")
+        # %-style args defer formatting until the logger accepts the record
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("_handle_queued_command_result: command=%s, success=%s, result_length=%d",
+                          command, success, len(result))
         if success:
-            logging.info(f"Command completed successfully: {command}\nResult: {result}")
+            logging.info("Command completed successfully: %s\nResult: %s", command, result)
         else:
-            logging.error(f"Command failed: {command}\nError: {result}")
+            logging.error("Command failed: %s\nError: %s", command, result)
             
     def log_command_result(self, command: str, result: str, success: bool, token=None):
         """
@@ -86,9 +146,9 @@ class LoggingService:
                     protocol=token.token_type
                 )
             else:
-                logging.warning(f"Unable to log command result: missing token information")
+                logging.warning("Unable to log command result: missing token information")
         except Exception as e:
-            logging.error(f"Failed to log command result: {str(e)}")
+            logging.error("Failed to log command result: %s", e)
     
     def log_telnet_command_finished(self, response: str, automatic: bool, current_token, 
                                    node_manager, status_message_signal, log_writer, 
@@ -116,21 +176,36 @@ class LoggingService:
             # Only write to log for manual commands when explicitly requested
             if current_token and response.strip():
                 try:
-                    logging.debug(f"Processing manual command for token {current_token.token_id}")
-                    node = node_manager.get_node_by_token(current_token)
-                    if node:
-                        node_ip = node.ip_address.replace('.', '-') if node.ip_address else "unknown-ip"
-                        # Use composite key (token_id, protocol) to find log path
-                        key = (current_token.token_id, current_token.token_type.lower())
-                        log_path = log_writer.log_paths.get(key)
-                        if not log_path:
-                            logging.debug(f"Opening new log for token {current_token.token_id}")
-                            log_path = log_writer.open_log(node.name, node_ip, current_token, log_writer.get_log_path(node.name, node_ip, current_token))
-                        
-                        log_writer.append_to_log(current_token.token_id, response, protocol=current_token.token_type)
-                        logging.info(f"Successfully appended to log: {os.path.basename(log_path)}")
-                        if status_message_signal:
-                            status_message_signal.emit(f"Command output appended to {os.path.basename(log_path)}", 3000)
+                    logging.debug("Processing manual command for token %s", current_token.token_id)
+                    # Path and basename are stable per token, so resolve
+                    # them once and cache them by (token_id, token_type)
+                    cache_key = (current_token.token_id, current_token.token_type)
+                    cached = self._log_path_cache.get(cache_key)
+                    if cached is None:
+                        node = node_manager.get_node_by_token(current_token)
+                        if node is None:
+                            log_path = log_basename = None
+                        else:
+                            node_ip = node.ip_address.replace('.', '-') if node.ip_address else "unknown-ip"
+                            # Use composite key (token_id, protocol) to find log path
+                            key = (current_token.token_id, current_token.token_type.lower())
+                            log_path = log_writer.log_paths.get(key)
+                            if not log_path:
+                                logging.debug("Opening new log for token %s", current_token.token_id)
+                                log_path = log_writer.open_log(node.name, node_ip, current_token, log_writer.get_log_path(node.name, node_ip, current_token))
+                            log_basename = os.path.basename(log_path)
+                            self._log_path_cache[cache_key] = (log_path, log_basename)
+                    else:
+                        log_path, log_basename = cached
+                    if log_path:
+                        # Append on the writer thread so disk I/O never
+                        # stalls the event loop
+                        self._write_log_async(
+                            lambda: log_writer.append_to_log(
+                                current_token.token_id, response,
+                                protocol=current_token.token_type),
+                            f"Command output appended to {log_basename}",
+                            status_message_signal)
                     else:
                         logging.warning(f"Node not found for token {current_token.token_id}")
                         if status_message_signal:
@@ -145,14 +220,15 @@ class LoggingService:
                     # Check if token has a direct log path (from context menu)
                     log_path = getattr(current_token, 'log_path', None)
                     if log_path:
-                        # Write directly to the specified log file
-                        with open(log_path, 'a') as f:
-                            f.write(response + "\n")
-                        if status_message_signal:
-                            status_message_signal.emit(
-                                f"Command output appended to {os.path.basename(log_path)}",
-                                3000
-                            )
+                        # Write directly to the specified log file on the
+                        # writer thread
+                        def direct_write(path=log_path, text=response):
+                            with open(path, 'a') as f:
+                                f.write(text + "\n")
+                        self._write_log_async(
+                            direct_write,
+                            f"Command output appended to {os.path.basename(log_path)}",
+                            status_message_signal)
                     else:
                         # For automatic commands, always ensure we have a log file open
                         node = node_manager.get_node_by_token(current_token)
@@ -161,17 +237,15 @@ class LoggingService:
                             # Always call open_log for automatic commands to ensure proper log path generation
                             log_writer.open_log(node.name, node_ip, current_token, log_writer.get_log_path(node.name, node_ip, current_token))
                         
-                        # Fall back to standard log writer
-                        log_writer.append_to_log(
-                            current_token.token_id,
-                            response,
-                            protocol=current_token.token_type
-                        )
-                        if status_message_signal:
-                            status_message_signal.emit(
-                                "Command output logged",
-                                3000
-                            )
+                        # Fall back to standard log writer on the writer thread
+                        self._write_log_async(
+                            lambda: log_writer.append_to_log(
+                                current_token.token_id,
+                                response,
+                                protocol=current_token.token_type
+                            ),
+                            "Command output logged",
+                            status_message_signal)
                 except Exception as e:
                     logging.error(f"Log write error: {str(e)}")
                     if status_message_signal:
@@ -20,15 +20,23 @@ class RpcCommandService(QObject):
         self.node_manager = node_manager
         self.command_queue = command_queue
         self.logger = logging.getLogger(__name__)
-        
+        # Command text is a pure function of token ID and action; memoize
+        # so repeated subgroup processing reuses the same string
+        self._cmd_cache = {}
+
     def generate_rpc_command(self, token_id: str, action: str = "print") -> str:
         """Generate RPC command text for a token ID"""
-        normalized_token = self.normalize_token(token_id)
-        action_map = {
-            "print": "print from fbc rupi counters",
-            "clear": "clear fbc rupi counters"
-        }
-        return f"{action_map[action]} {normalized_token}0000"
+        key = (token_id, action)
+        command = self._cmd_cache.get(key)
+        if command is None:
+            normalized_token = self.normalize_token(token_id)
+            action_map = {
+                "print": "print from fbc rupi counters",
+                "clear": "clear fbc rupi counters"
+            }
+            command = f"{action_map[action]} {normalized_token}0000"
+            self._cmd_cache[key] = command
+        return command
     
     def normalize_token(self, token_id: str) -> str:
         """Normalize token ID to 3-digit format"""
@@ -93,7 +101,8 @@ class RpcCommandService(QObject):
             
             command = self.generate_rpc_command(token_id, action)
             self.logger.debug(f"RpcCommandService.queue_rpc_command: Generated command: {command}")
-            self.logger.debug(f"RpcCommandService.queue_rpc_command: Full token details: {vars(token)}")
+            # NodeToken is slotted, so use its dataclass repr instead of vars()
+            self.logger.debug(f"RpcCommandService.queue_rpc_command: Full token details: {token!r}")
             
             # Emit signals to update UI
             self.logger.debug("RpcCommandService.queue_rpc_command: Emitting UI update signals")
@@ -109,3 +118,40 @@ class RpcCommandService(QObject):
             self.logger.error(f"Error queuing RPC command: {str(e)}", exc_info=True)
             self.report_error.emit(str(e))
             self.status_message.emit(f"Error queuing command: {str(e)}", 5000)
+
+    def queue_rpc_commands(self, node_name: str, token_ids, action: str = "print", telnet_client=None):
+        """Queue RPC commands for a batch of tokens with one processing start
+
+        Commands are enqueued with auto_start disabled so the queue starts
+        once for the whole batch instead of once per token, and the UI
+        signals fire once rather than per command.
+        """
+        self.logger.info(f"RpcCommandService.queue_rpc_commands: Queuing {len(token_ids)} '{action}' commands for node '{node_name}'")
+        # Coalesce progress into one emission when this batch drains
+        self.command_queue.defer_taskrun = True
+        command = None
+        queued = 0
+        for token_id in token_ids:
+            # One bad token skips only itself, as in the per-token API
+            try:
+                token = self.get_token(node_name, token_id)
+
+                # Ensure log file is initialized before queuing command
+                self._initialize_log_file(token)
+
+                command = self.generate_rpc_command(token_id, action)
+                self.command_queue.add_command(command, token, telnet_client, auto_start=False)
+                queued += 1
+            except Exception as e:
+                self.logger.error(f"Error queuing RPC command for token {token_id}: {str(e)}", exc_info=True)
+                self.report_error.emit(str(e))
+                self.status_message.emit(f"Error queuing command: {str(e)}", 5000)
+
+        if queued == 0:
+            return
+
+        # Emit signals to update UI once for the batch
+        self.set_command_text.emit(command)
+        self.switch_to_telnet_tab.emit()
+        self.focus_command_input.emit()
+        self.status_message.emit(f"Queued {queued} RPC commands for node {node_name}", 3000)
@@ -2,7 +2,9 @@
 Telnet Service - Handles Telnet connection management and command execution
 """
 import logging
+import queue
 import socket
+import threading
 import time
 from typing import Optional
 
@@ -31,7 +33,10 @@ class TelnetService:
         self.session_manager = session_manager
         self.command_resolver = CommandResolver()
         self.threading_service = ThreadingService()
-        self.telnet_lock = self.threading_service.create_lock()
+        # Single long-lived worker drains this queue; commands serialize
+        # naturally without a lock or a new thread per keystroke
+        self._cmd_queue = queue.Queue()
+        self._cmd_worker = None
         self.active_telnet_client = None
         self.telnet_session = None
         self.current_token = None
@@ -51,7 +56,9 @@ class TelnetService:
             token: The token to set as current
         """
         self.current_token = token
-        logging.debug(f"TelnetService: Current token set to {token.token_id if token else None}")
+        # %-style args defer formatting until the logger accepts the record
+        logging.debug("TelnetService: Current token set to %s",
+                      token.token_id if token else None)
     
     def toggle_connection(self, connect: bool, ip_address: str, port: int, settings=None) -> bool:
         """
@@ -182,39 +189,49 @@ class TelnetService:
         Returns:
             str: Empty string (response will be handled asynchronously)
         """
+        # Bail on empty input before any session or signal work; this
+        # runs for every stray Enter in the command box
+        command = command.strip()
+        if not command:
+            logging.debug("Empty command received in execute_command")
+            return ""
+
         # Prioritize active manual connection if available
-        if hasattr(self, 'active_telnet_client') and self.active_telnet_client and self.active_telnet_client.is_connected:
+        # (always assigned in __init__, so no hasattr probe is needed)
+        if self.active_telnet_client is not None and self.active_telnet_client.is_connected:
             self.telnet_session = self.active_telnet_client
-            
+
         if not self.telnet_session:
             if not automatic and self.status_message_signal:
                 self.status_message_signal.emit("Create a Telnet session first!", self.STATUS_MSG_MEDIUM)
             logging.debug("Telnet session not available for command execution")
             return ""
-        
-        command = command.strip()
-        if not command:
-            logging.debug("Empty command received in execute_command")
-            return ""
-        logging.debug(f"Executing telnet command: {command} (automatic={automatic})")
-            
-        logging.debug(f"Executing telnet command: {command}")
-        logging.debug(f"DEBUG: Automatic={automatic}, Current token: {self.current_token.token_id if self.current_token else 'None'}")
+        logging.debug("Executing telnet command: %s (automatic=%s)", command, automatic)
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("DEBUG: Automatic=%s, Current token: %s", automatic,
+                          self.current_token.token_id if self.current_token else 'None')
 
         if not automatic:
             # Display user command in output
             if self.command_finished_signal:
                 self.command_finished_signal.emit(f"> {command}\n", automatic)
             
-        # Start command execution in background thread
-        self.threading_service.start_thread(
-            target=self._run_command,
-            args=(command, automatic),
-            daemon=True
-        )
-        
+        # Hand the command to the persistent worker thread
+        if self._cmd_worker is None:
+            self._cmd_worker = self.threading_service.start_thread(
+                target=self._command_loop,
+                daemon=True
+            )
+        self._cmd_queue.put((command, automatic))
+
         return ""  # Response will be handled asynchronously
 
+    def _command_loop(self):
+        """Drain queued commands on the persistent worker thread"""
+        while True:
+            command, automatic = self._cmd_queue.get()
+            self._run_command(command, automatic)
+
     def _run_command(self, command, automatic):
         """
         Runs telnet command in background thread with improved error handling.
@@ -223,25 +240,28 @@ class TelnetService:
             command: Command to execute
             automatic: Whether command was triggered automatically
         """
-        with self.telnet_lock:
-            try:
-                token_id = self.current_token.token_id if self.current_token else ""
-                resolved_cmd = self.command_resolver.resolve(command, token_id)
-                response = self.telnet_session.send_command(resolved_cmd, timeout=5)
-                
-                if self.update_connection_status_signal:
-                    self.update_connection_status_signal.emit(ConnectionState.CONNECTED)
-                    
-            except (ConnectionRefusedError, TimeoutError, socket.timeout) as e:
-                response = f"ERROR: {type(e).__name__} - {str(e)}"
-                self._handle_connection_error(e)
-            except Exception as e:
-                response = f"ERROR: {type(e).__name__} - {str(e)}"
-                logging.error(f"Telnet command failed: {command}", exc_info=True)
-            
-            logging.debug(f"Emitting command_finished signal for command: {command}")
-            if self.command_finished_signal:
-                self.command_finished_signal.emit(response, automatic)
+        # Single-consumer invariant: ordering comes from the one worker
+        # draining the queue, not from a lock
+        assert threading.current_thread() is self._cmd_worker, \
+            "_run_command must only run on the telnet command worker"
+        try:
+            token_id = self.current_token.token_id if self.current_token else ""
+            resolved_cmd = self.command_resolver.resolve(command, token_id)
+            response = self.telnet_session.send_command(resolved_cmd, timeout=5)
+
+            if self.update_connection_status_signal:
+                self.update_connection_status_signal.emit(ConnectionState.CONNECTED)
+
+        except (ConnectionRefusedError, TimeoutError, socket.timeout) as e:
+            response = f"ERROR: {type(e).__name__} - {str(e)}"
+            self._handle_connection_error(e)
+        except Exception as e:
+            response = f"ERROR: {type(e).__name__} - {str(e)}"
+            logging.error("Telnet command failed: %s", command, exc_info=True)
+
+        logging.debug("Emitting command_finished signal for command: %s", command)
+        if self.command_finished_signal:
+            self.command_finished_signal.emit(response, automatic)
     
     def _handle_connection_error(self, error):
         """
@@ -3,6 +3,7 @@ Session Manager
 Handles Telnet, VNC, and FTP session connections
 """
 import telnetlib
+import selectors
 import socket
 import time
 import re
@@ -52,7 +53,11 @@ class BaseSession:
     
     def send_command(self, command: str) -> str:
         raise NotImplementedError("Subclasses must implement send_command()")
-    
+
+    def is_alive(self) -> bool:
+        """Cheap liveness probe used before reusing a pooled session"""
+        return self.is_connected
+
     def get_current_state(self) -> str:
         """Returns a string representation of connection state"""
         return f"{self.config.session_type.name} - {'Connected' if self.is_connected else 'Disconnected'}"
@@ -62,7 +67,21 @@ class TelnetSession(BaseSession):
         super().__init__(config)
         self.buffer = b""
         self.prompt_pattern = re.compile(r'\d+[a-z]\%\s*$')
-        
+
+    def is_alive(self) -> bool:
+        """Connected flag plus a live underlying socket
+
+        The is_connected flag can go stale when the peer drops silently;
+        checking the socket object catches sessions telnetlib has already
+        torn down without paying for a network round trip.
+        """
+        if not self.is_connected or not self.connection:
+            return False
+        try:
+            return self.connection.get_socket() is not None
+        except Exception:
+            return False
+
     def connect(self) -> bool:
         try:
             # Log connection parameters
@@ -174,45 +193,46 @@ class TelnetSession(BaseSession):
             return error
 
     def _read_response(self, timeout: float) -> str:
-        """Read telnet response with prompt detection"""
+        """Read telnet response with prompt detection
+
+        Waits for socket readability with a selector instead of polling a
+        50 ms recv probe, so idle waits cost no CPU and never consume a
+        data byte, and the deadline is honored cooperatively.
+        """
         response = b""
-        start_time = time.time()
-        last_data_time = time.time()
-        
+        deadline = time.monotonic() + timeout
+
         logging.debug(f"TelnetSession._read_response: Starting read with timeout={timeout}s")
-        
-        while (time.time() - start_time) < timeout:
-            chunk = self.connection.read_very_eager()
-            if chunk:
-                response += chunk
-                last_data_time = time.time()
-                decoded = response.decode('ascii', 'ignore')
-                logging.debug(f"TelnetSession._read_response: Received {len(chunk)} bytes, total {len(response)}")
-                
-                if self.prompt_pattern.search(decoded):
-                    logging.debug("TelnetSession._read_response: Detected prompt pattern")
-                    break
-                    
-            # Use non-blocking wait instead of sleep
-            self.connection.get_socket().settimeout(0.05)
-            try:
-                test_byte = self.connection.get_socket().recv(1)
-                if test_byte == b'':
+
+        sel = selectors.DefaultSelector()
+        try:
+            sel.register(self.connection.get_socket(), selectors.EVENT_READ)
+            while (remaining := deadline - time.monotonic()) > 0:
+                try:
+                    chunk = self.connection.read_very_eager()
+                except EOFError:
                     logging.debug("TelnetSession._read_response: Socket closed by remote")
                     break
-            except socket.timeout:
-                # Check if we've had no data for too long
-                if (time.time() - last_data_time) > (timeout / 2):
+                if chunk:
+                    response += chunk
+                    decoded = response.decode('ascii', 'ignore')
+                    logging.debug(f"TelnetSession._read_response: Received {len(chunk)} bytes, total {len(response)}")
+
+                    if self.prompt_pattern.search(decoded):
+                        logging.debug("TelnetSession._read_response: Detected prompt pattern")
+                        break
+                    continue
+
+                # No buffered data: block until the socket is readable,
+                # bailing out after half the timeout without data
+                if not sel.select(min(remaining, timeout / 2)):
                     logging.warning("TelnetSession._read_response: No data received for half of timeout period")
                     break
-                continue
-            except EOFError as e:
-                logging.error(f"TelnetSession._read_response: EOFError - {str(e)}")
-                break
-            except Exception as e:
-                logging.error(f"TelnetSession._read_response: Error reading socket - {str(e)}")
-                break
-                
+        except Exception as e:
+            logging.error(f"TelnetSession._read_response: Error reading socket - {str(e)}")
+        finally:
+            sel.close()
+
         result = response.decode('ascii', 'ignore') if response else ""
         logging.debug(f"TelnetSession._read_response: Returning {len(result)} chars")
         return result
@@ -283,7 +303,9 @@ class SessionManager:
         cache_key = (config.host, config.port, config.session_type)
         if cache_key in self.session_cache:
             existing = self.session_cache[cache_key]
-            if existing.is_connected:
+            # Probe liveness, not just the connected flag, so a silently
+            # dropped peer doesn't hand back a dead socket
+            if existing.is_alive():
                 logging.debug(f"Reusing existing session for {cache_key}")
                 return existing
             else:
@@ -245,6 +245,8 @@ class CommanderUIFactory:
         content.setPlaceholderText(f"{tab_type} session will appear here")
         content.setStyleSheet("background:#1A1A1A; color:#DDD;")
         layout.addWidget(content, 5)
+        # Direct reference so consumers can skip the layout walk per access
+        tab.content_widget = content
         
         # Connection Bar (VNC/FTP uses a generic one for now)
         # Note: IP/Port will be updated dynamically later
@@ -2,7 +2,8 @@
 Commander Window - Main UI view for the Commander application
 """
 from PyQt6.QtWidgets import QMainWindow, QStatusBar
-from PyQt6.QtCore import QSettings, pyqtSignal
+from PyQt6.QtCore import QSettings, QTimer, pyqtSignal
+from PyQt6.QtGui import QTextCursor
 
 from ..services.context_menu_service import ContextMenuService
 from ..services.context_menu_filter import ContextMenuFilterService
@@ -27,6 +28,10 @@ from ..command_queue import CommandQueue
 # Centralized Qt application initialization
 from ..qt_init import initialize_qt
 
+# Resolved once; the nested enum lookup costs two attribute fetches per
+# use on the output flush path
+_CURSOR_END = QTextCursor.MoveOperation.End
+
 
 class CommanderWindow(QMainWindow):
     """Main Commander window view."""
@@ -55,7 +60,15 @@ class CommanderWindow(QMainWindow):
         self.command_queue = CommandQueue(self.session_manager, parent=self)
         self.log_writer = LogWriter(self.node_manager)
         self.current_token = None
-        
+
+        # Coalesce terminal output so bursts repaint once per frame
+        # instead of once per appended response
+        self._pending_output = []
+        self._output_flush_timer = QTimer(self)
+        self._output_flush_timer.setSingleShot(True)
+        self._output_flush_timer.setInterval(16)
+        self._output_flush_timer.timeout.connect(self._flush_output)
+
         # Initialize all components
         self._initialize_components()
     
@@ -271,16 +284,35 @@ class CommanderWindow(QMainWindow):
         self.telnet_service.set_current_token(self.current_token)
         return self.telnet_service.execute_command(self.cmd_input.toPlainText().strip(), automatic)
     
+    def _append_output(self, text):
+        """Queue text for the telnet output, flushed once per frame"""
+        self._pending_output.append(text)
+        if not self._output_flush_timer.isActive():
+            self._output_flush_timer.start()
+
+    def _flush_output(self):
+        """Insert all pending output in one layout/repaint pass"""
+        if not self._pending_output:
+            return
+        text = "\n".join(self._pending_output) + "\n"
+        self._pending_output.clear()
+        self.telnet_output.setUpdatesEnabled(False)
+        try:
+            cursor = self.telnet_output.textCursor()
+            cursor.movePosition(_CURSOR_END)
+            cursor.insertText(text)
+        finally:
+            self.telnet_output.setUpdatesEnabled(True)
+        self.telnet_output.moveCursor(_CURSOR_END)
+
     def on_telnet_command_finished(self, response, automatic):
         """Handles the completion of a telnet command run in a background thread"""
         # For automatic commands, show command + response
         if automatic:
-            self.telnet_output.append(f"{response}\n")
+            self._append_output(f"{response}\n")
         else:
-            self.telnet_output.append(response)
-        from PyQt6.QtGui import QTextCursor
-        self.telnet_output.moveCursor(QTextCursor.MoveOperation.End)
-        
+            self._append_output(response)
+
         # Delegate logging to commander service
         self.commander_service.log_telnet_command_finished(
             response, automatic, self.current_token, self.node_manager,
@@ -324,6 +356,7 @@ class CommanderWindow(QMainWindow):
         """Cleanup on window close"""
         self.telnet_service.disconnect()
         self.log_writer.close_all_logs()
+        self.commander_presenter.close_log_handles()
         
         # Save application state
         self.settings.setValue("config_path", self.node_manager.config_path)
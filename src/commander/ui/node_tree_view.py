@@ -41,6 +41,11 @@ class NodeTreeView(QWidget):
         self.node_tree.setHeaderLabels(["Nodes"])
         self.node_tree.setColumnWidth(0, 300)
         self.node_tree.setFont(QFont("Consolas", 10))
+        # All rows share one height; lets Qt skip per-row height probing
+        # during expansion and scrolling
+        self.node_tree.setUniformRowHeights(True)
+        self.node_tree.setAnimated(False)
+        self.node_tree.setSortingEnabled(False)
         
         layout.addWidget(self.node_tree, 1)  # Add stretch factor
         
@@ -72,6 +77,18 @@ class NodeTreeView(QWidget):
     def add_top_level_item(self, item):
         """Add a top level item to the tree"""
         self.node_tree.addTopLevelItem(item)
+
+    def add_top_level_items(self, items):
+        """Add multiple top level items to the tree in a single model update"""
+        self.node_tree.blockSignals(True)
+        try:
+            self.node_tree.addTopLevelItems(items)
+        finally:
+            self.node_tree.blockSignals(False)
+
+    def set_updates_enabled(self, enabled):
+        """Enable or disable tree repaints during bulk changes"""
+        self.node_tree.setUpdatesEnabled(enabled)
         
     def set_status_message(self, message):
         """Set status message (for compatibility with existing code)"""
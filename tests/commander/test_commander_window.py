@@ -139,8 +139,10 @@ class TestCommanderWindowTokenQueue(unittest.TestCase):
             mock_item.parent.return_value = mock_section_item
             
             self.window.node_tree_presenter.process_all_fbc_subgroup_commands(mock_item)
-            # Verify that the FBC service queue method was called for each token
-            self.assertEqual(self.mock_fbc_service.queue_fieldbus_command.call_count, 2)
+            # Verify that the FBC service batch queue method received both tokens
+            self.mock_fbc_service.queue_fieldbus_commands.assert_called_once()
+            queued_token_ids = self.mock_fbc_service.queue_fieldbus_commands.call_args[0][1]
+            self.assertEqual(queued_token_ids, ["123", "456"])
             # Verify that the command queue start method was called
             self.mock_command_queue.start_processing.assert_called_once()
             # Verify status messages